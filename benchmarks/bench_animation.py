@@ -0,0 +1,40 @@
+# Benchmark animasi reaksi: render PIL vs baca dari cache disk, dan pengusiran LRU
+#
+# Jalankan: python benchmarks/bench_animation.py
+import tempfile
+import time
+import timeit
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.animation import render_beaker_gif
+from lab_kimia.core import get_datasets, get_reaction_colors
+from lab_kimia.diskcache import DiskLRUCache
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number
+
+
+def main():
+    reactions = get_datasets()[2]
+    colors = [get_reaction_colors(r) for r in reactions]
+    render = best(lambda: render_beaker_gif(*colors[0]), 3)
+    sample = render_beaker_gif(*colors[0])
+    print(f"render satu animasi: {render * 1e3:.1f} ms, {len(sample) / 1024:.1f} KiB")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Batas cukup untuk kira-kira sepertiga animasi agar pengusiran terjadi
+        cache = DiskLRUCache(directory, max_bytes=len(sample) * len(reactions) // 3, suffix=".gif")
+        start = time.perf_counter()
+        for i, pair in enumerate(colors):
+            cache.put(i, render_beaker_gif(*pair))
+        print(f"{len(reactions)} animasi dirender dan disimpan dalam {time.perf_counter() - start:.2f} s")
+        print(f"ukuran cache {cache.size / 1024:.1f} KiB (batas {cache.max_bytes / 1024:.1f} KiB), "
+              f"{len(cache.entries())} entri tersisa")
+        last = len(reactions) - 1
+        print(f"baca dari cache disk: {best(lambda: cache.get(last), 200) * 1e6:.0f} µs")
+        print(f"entri tertua terusir: {cache.get(0) is None}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Benchmark waktu server per klik di simulator reaksi, lewat server sungguhan
+#
+# Satu sesi websocket (protokol yang sama dengan loadtest.py) membuka halaman
+# simulator, lalu bergantian mengganti senyawa dan menekan "⚡ Lakukan Reaksi"
+# untuk setiap pasangan yang bereaksi. Dicatat latensi setiap klik (kirim
+# BackMsg -> script_finished) dan waktu CPU server per klik. Widget di dalam
+# fragmen dikirim dengan fragment_id seperti browser, sehingga yang diukur
+# adalah rerun fragmen saja.
+#
+# Jalankan: python benchmarks/bench_clicks.py [--rounds 10] [--app simulasi.py lain]
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from harness import ROOT
+from lab_kimia.core import get_datasets
+from loadtest import Session, percentile, read_stats, wait_until_healthy
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+SIMULATOR = "🧪 Simulator Reaksi"
+ACTIONS = ("pilih senyawa", "lakukan reaksi")
+
+
+async def click(session, action, pair):
+    if action == "pilih senyawa":
+        for key, name in zip(("compound1", "compound2"), pair):
+            session._set(key, session._index(key, name))
+        await session.rerun(action, [], session.fragment_of("compound1"))
+    else:
+        trigger = WidgetState(id=session.widgets["react_button"][1], trigger_value=True)
+        await session.rerun(action, [trigger], session.fragment_of("react_button"))
+
+
+async def run_clicks(url, rounds):
+    reactions = get_datasets()[2]
+    session = Session(url, random.Random(0), reactions)
+    await session.connect()
+    session._set("page", session._index("page", SIMULATOR))
+    await session.rerun("pindah halaman", [])
+    options = session.widgets["compound1"][2]
+    pairs = [r["reagents"] for r in reactions if all(name in options for name in r["reagents"])]
+
+    # Satu putaran pemanasan: animasi, grafik dan cache lain terisi untuk semua reaksi
+    for pair in pairs:
+        for action in ACTIONS:
+            await click(session, action, pair)
+    fragment = session.fragment_of("react_button")
+    session.latencies.clear()
+
+    await asyncio.sleep(1.0)
+    started = time.time()
+    for _ in range(rounds):
+        for pair in pairs:
+            for action in ACTIONS:
+                await click(session, action, pair)
+    finished = time.time()
+    await asyncio.sleep(1.0)
+    session.close()
+    return session, fragment, started, finished
+
+
+def report(session, fragment, samples, started, finished):
+    before = [s for s in samples if s["time"] <= started][-1]
+    after = min((s for s in samples if s["time"] >= finished), key=lambda s: s["time"], default=samples[-1])
+    count = len(session.latencies)
+    print(f"{count} klik, fragmen: {'ya' if fragment else 'tidak (rerun seluruh skrip)'}, "
+          f"{session.errors} exception di aplikasi")
+    for action in ACTIONS:
+        values = sorted(seconds for name, seconds in session.latencies if name == action)
+        print(f"  {action:<15} median {statistics.median(values) * 1e3:6.1f} ms  "
+              f"p90 {percentile(values, 0.90):6.1f} ms  maks {values[-1] * 1e3:6.1f} ms")
+    print(f"  CPU server      {(after['cpu'] - before['cpu']) / count * 1e3:6.1f} ms per klik")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Waktu server per klik di simulator reaksi")
+    parser.add_argument("--rounds", type=int, default=10, help="jumlah putaran semua pasangan yang bereaksi")
+    parser.add_argument("--app", default=None, help="simulasi.py lain untuk dibandingkan (mis. versi sebelumnya)")
+    parser.add_argument("--port", type=int, default=8598)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_path = os.path.join(tmp, "server_stats.jsonl")
+        command = [sys.executable, os.path.join(ROOT, "benchmarks", "loadtest_server.py"), stats_path, str(args.port)]
+        server = subprocess.Popen(command + ([os.path.abspath(args.app)] if args.app else []),
+                                  cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_healthy(args.port)
+            url = f"ws://localhost:{args.port}/_stcore/stream"
+            session, fragment, started, finished = asyncio.run(run_clicks(url, args.rounds))
+            samples = read_stats(stats_path)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    report(session, fragment, samples, started, finished)
+
+
+if __name__ == "__main__":
+    main()
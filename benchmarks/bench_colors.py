@@ -0,0 +1,37 @@
+# Benchmark matriks warna campuran untuk semua pasangan senyawa
+#
+# Jalankan: python benchmarks/bench_colors.py [jumlah_senyawa]
+import sys
+import time
+import timeit
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.colors import ColorMixer
+from lab_kimia.core import DEFAULT_COLOR, get_datasets
+
+
+# Senyawa sintetis dengan warna acak deterministik; reaksi asli tetap disertakan
+def make_compounds(n):
+    compounds = dict(get_datasets()[1])
+    for i in range(n - len(compounds)):
+        compounds[f"Senyawa {i}"] = {"color": f"#{(i * 2654435761) & 0xFFFFFF:06X}"}
+    return compounds
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    compounds = make_compounds(n)
+    reactions = get_datasets()[2]
+    start = time.perf_counter()
+    mixer = ColorMixer(compounds, reactions, DEFAULT_COLOR)
+    elapsed = time.perf_counter() - start
+    print(f"{n} senyawa, {n * n:,} pasangan: matriks dalam {elapsed * 1e3:.1f} ms, {mixer.rgb.nbytes / 2**20:.1f} MiB")
+
+    names = list(compounds)
+    a, b = names[n // 3], names[2 * n // 3]
+    per_lookup = min(timeit.repeat(lambda: mixer.mix(a, b), number=10000, repeat=5)) / 10000
+    print(f"satu pencarian warna: {per_lookup * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Benchmark pemeriksaan kompatibilitas rak berisi banyak bahan kimia
+#
+# Jalankan: python benchmarks/bench_compatibility.py [jumlah_bahan]
+import sys
+import time
+import timeit
+from itertools import combinations
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.compatibility import CompatibilityEngine
+from lab_kimia.core import get_datasets
+
+
+# Senyawa sintetis: jenis dan bahaya senyawa asli diulang dengan nama unik
+def make_compounds(n):
+    base = list(get_datasets()[1].values())
+    return {f"Bahan {i}": base[i % len(base)] for i in range(n)}
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    compounds = make_compounds(n)
+    start = time.perf_counter()
+    engine = CompatibilityEngine(compounds)
+    print(f"{n} bahan, mesin dibangun dalam {time.perf_counter() - start:.2f} s")
+
+    names = list(compounds)
+    codes = engine.encode(names)
+    violations = engine.check_shelf(codes)
+    print(f"rak penuh   {best(lambda: engine.check_shelf(codes), 20) * 1e3:8.3f} ms  ({len(violations)} pelanggaran)")
+    print(f"encode+cek  {best(lambda: engine.check_shelf(engine.encode(names)), 20) * 1e3:8.3f} ms")
+
+    safe = engine.encode([name for name in names if not engine.masks[engine.codes[name]]])
+    print(f"rak aman    {best(lambda: engine.check_shelf(safe), 20) * 1e3:8.3f} ms  ({len(safe)} bahan)")
+
+    # Pembanding: cek pasangan satu per satu pada sebagian kecil rak
+    sample = names[:300]
+    pairwise = best(lambda: [engine.check_pair(a, b) for a, b in combinations(sample, 2)], 1)
+    print(f"per pasangan ({len(sample)} bahan) {pairwise * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
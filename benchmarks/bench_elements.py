@@ -0,0 +1,51 @@
+# Benchmark ElementStore vs daftar dict: memori, pencarian dan filter
+#
+# Jalankan: python benchmarks/bench_elements.py [jumlah_unsur]
+import sys
+import timeit
+import tracemalloc
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_datasets
+from lab_kimia.elements import ElementStore
+
+
+# Tabel sintetis: unsur asli diulang dengan nomor atom unik
+def make_table(n):
+    base = get_datasets()[0]
+    return [
+        {**base[i % len(base)], "AtomicNumber": i + 1, "Symbol": f"X{i}", "Hazards": list(base[i % len(base)]["Hazards"])}
+        for i in range(n)
+    ]
+
+
+def measure(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    table, dict_bytes = measure(lambda: make_table(n))
+    store = ElementStore(table)
+    target = n // 2
+
+    print(f"{n} unsur")
+    print(f"memori daftar dict : {dict_bytes / n:.0f} byte/unsur")
+    print(f"memori kolom NumPy : {store.nbytes / n:.0f} byte/unsur")
+    print(f"cari nomor (linear): {best(lambda: next(e for e in table if e['AtomicNumber'] == target), 20) * 1e6:.0f} µs")
+    print(f"cari nomor (store) : {best(lambda: store.row(target), 100_000) * 1e9:.0f} ns")
+    print(f"filter (list comp) : {best(lambda: [e for e in table if e['Category'] == 'Halogen'], 20) * 1e3:.2f} ms")
+    print(f"filter (mask)      : {best(lambda: store.mask(category='Halogen'), 200) * 1e3:.3f} ms")
+    print(f"urut massa (store) : {best(lambda: store.sort_by('mass'), 20) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Benchmark parser rumus dan massa molar tervektorisasi untuk puluhan ribu rumus
+#
+# Jalankan: python benchmarks/bench_formula.py [jumlah_rumus]
+import random
+import sys
+import time
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_datasets
+from lab_kimia.formula import molar_masses, parse_formula
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    periodic_table, compounds, _ = get_datasets()
+    base = [c["formula"] for c in compounds.values() if "Ag" not in c["formula"] and "I" not in c["formula"]]
+    rng = random.Random(0)
+    # Rumus sintetis yang berbeda-beda, misalnya (H₂SO₄)3·4H₂O
+    formulas = [f"({rng.choice(base)}){rng.randint(1, 9)}·{rng.randint(1, 9)}H₂O" for _ in range(n)]
+    distinct = len(set(formulas))
+
+    parse_formula.cache_clear()
+    start = time.perf_counter()
+    molar_masses(formulas, periodic_table)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    molar_masses(formulas, periodic_table)
+    warm = time.perf_counter() - start
+
+    print(f"{n} rumus ({distinct} unik)")
+    print(f"pertama (parse + matriks): {cold * 1e3:.1f} ms")
+    print(f"ulang (hasil parse dari memo): {warm * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Benchmark kueri graf reaksi pada basis data reaksi sintetis berukuran besar
+#
+# Jalankan: python benchmarks/bench_graph.py [jumlah_reaksi]
+import random
+import sys
+import time
+import timeit
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.graph import ReactionGraph
+
+
+# Reaksi acak A + B -> C (+ D) atas kumpulan senyawa sepuluh kali lebih kecil
+def make_reactions(n):
+    rng = random.Random(0)
+    compounds = [f"Senyawa {i}" for i in range(max(n // 10, 4))]
+    return [
+        {"reagents": rng.sample(compounds, 2), "products": rng.sample(compounds, rng.choice((1, 2)))}
+        for _ in range(n)
+    ]
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    reactions = make_reactions(n)
+    start = time.perf_counter()
+    graph = ReactionGraph(reactions)
+    print(f"{n} reaksi, {len(graph.compounds)} senyawa, graf dibangun dalam {time.perf_counter() - start:.2f} s")
+
+    product = reactions[n // 2]["products"][0]
+    compound = reactions[n // 2]["reagents"][0]
+    linear = best(lambda: [i for i, r in enumerate(reactions) if product in r["products"]], 5)
+    print(f"penghasil produk   linear {linear * 1e3:8.3f} ms   graf {best(lambda: graph.producing(product), 10000) * 1e6:7.2f} µs")
+    print(f"pasangan reaksi    graf {best(lambda: graph.partners_of(compound), 10000) * 1e6:7.2f} µs")
+
+    start_set = graph.compounds[:len(graph.compounds) // 10]
+    target = reactions[-1]["products"][0]
+    route = graph.route(start_set, target, max_steps=6)
+    print(f"rute sintesis      {best(lambda: graph.route(start_set, target, max_steps=6), 5) * 1e3:8.3f} ms  "
+          f"({'tidak terjangkau' if route is None else f'{len(route)} reaksi'})")
+
+
+if __name__ == "__main__":
+    main()
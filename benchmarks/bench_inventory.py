@@ -0,0 +1,53 @@
+# Benchmark audit inventaris streaming: throughput dan memori puncak
+#
+# Jalankan: python benchmarks/bench_inventory.py [jumlah_baris]
+import csv
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_compatibility_engine, get_datasets, get_inventory_aliases
+from lab_kimia.formula import to_ascii
+from lab_kimia.inventory import DISPLAY_FORMULA, audit_inventory
+
+
+# Inventaris sintetis: senyawa acak ditulis sebagai nama tampilan, nama saja atau
+# rumus ASCII (plus beberapa nama tak dikenal) di 500 lokasi
+def write_inventory(path, n):
+    compounds = get_datasets()[1]
+    names = [alias for name, c in compounds.items()
+             for alias in (name, DISPLAY_FORMULA.sub("", name), to_ascii(c["formula"]))] + ["Zat Tak Dikenal"]
+    rng = random.Random(0)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["compound", "location", "quantity"])
+        for _ in range(n):
+            writer.writerow([rng.choice(names), f"Lemari {rng.randrange(500)}", rng.randrange(1, 1000)])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    engine = get_compatibility_engine()
+    aliases = get_inventory_aliases()
+    with tempfile.NamedTemporaryFile(suffix=".csv") as tmp:
+        write_inventory(tmp.name, n)
+        for chunk_rows in (10_000, 50_000, 200_000):
+            start = time.perf_counter()
+            report = audit_inventory(tmp.name, engine, chunk_rows=chunk_rows, aliases=aliases)
+            elapsed = time.perf_counter() - start
+
+            # Memori diukur pada putaran terpisah karena tracemalloc memperlambat parser
+            tracemalloc.start()
+            audit_inventory(tmp.name, engine, chunk_rows=chunk_rows, aliases=aliases)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"potongan {chunk_rows:>7} baris: {elapsed:6.2f} s  ({n / elapsed:>9,.0f} baris/s)  "
+                  f"memori puncak {peak / 2**20:6.1f} MiB  {len(report['violations'])} pelanggaran, "
+                  f"{report['unknown_rows']:,} baris tak dikenal")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Benchmark simulasi kinetika: satu batch RK4 vs simulasi satu per satu
+#
+# Jalankan: python benchmarks/bench_kinetics.py
+import time
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_datasets, reaction_kinetics
+from lab_kimia.kinetics import reaction_species, simulate, sweep_values
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    equation = get_datasets()[2][0]["equation"]
+    _, nu = reaction_species(equation)
+    for count in (100, 1000, 5000):
+        ks = sweep_values(0.01, 10.0, count, log=True)
+        batched = timed(lambda: simulate(nu, ks, 1.0, 1.0, 10.0))
+        line = f"{count:>5} nilai k: batch {batched * 1e3:8.1f} ms"
+        if count <= 1000:
+            looped = timed(lambda: [simulate(nu, k, 1.0, 1.0, 10.0) for k in ks])
+            line += f"   satu per satu {looped * 1e3:8.1f} ms  ({looped / batched:.0f}x)"
+        print(line)
+
+    # Rasio pereaksi bukan 1:1: pereaksi berlebih tersisa setelah pembatas habis
+    reactions = get_datasets()[2]
+    ks = sweep_values(0.01, 10.0, 5000, log=True)
+    for number in (1, 10, 3, 14):
+        equation = reactions[number - 1]["equation"]
+        _, nu = reaction_species(equation)
+        elapsed = timed(lambda: simulate(nu, ks, 1.0, 1.0, 60.0))
+        print(f"reaksi {number:>2} ({-nu[0]:.0f}:{-nu[1]:.0f}), 5000 nilai k, 60 s: {elapsed * 1e3:8.1f} ms")
+
+    sweep = ("k", 0.01, 10.0, 1000)
+    reaction_kinetics.cache_clear()
+    cold = timed(lambda: reaction_kinetics(0, 1.0, 1.0, 1.0, 10.0, sweep))
+    warm = timed(lambda: reaction_kinetics(0, 1.0, 1.0, 1.0, 10.0, sweep))
+    print(f"reaction_kinetics (1000 nilai): pertama {cold * 1e3:.1f} ms, dari cache {warm * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
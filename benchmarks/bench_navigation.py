@@ -0,0 +1,52 @@
+# Waktu rerun per interaksi (median) untuk interaksi utama di tiap bagian
+#
+# Bekerja untuk versi st.tabs maupun versi radio "page" (lihat open_section),
+# sehingga bisa dijalankan di checkout versi lama untuk perbandingan sebelum/sesudah,
+# mis. lewat `git worktree add`. bench_reruns.py hanya mendukung versi radio.
+#
+# Jalankan: python benchmarks/bench_navigation.py
+import statistics
+
+from harness import new_app, payload_stats, timed_run
+
+REPEAT = 15
+
+COMPOUNDS = ["Besi (Fe)", "Asam Klorida (HCl)"]
+CATEGORIES = ["Halogen", "Semua"]
+
+# (bagian, nama, persiapan, aksi)
+INTERACTIONS = [
+    ("📋 Tabel Periodik", "filter kategori", None,
+     lambda at, i: at.selectbox(key="category_filter").select(CATEGORIES[i % 2])),
+    ("🧪 Simulator Reaksi", "pilih senyawa", None,
+     lambda at, i: at.selectbox(key="compound1").select(COMPOUNDS[i % 2])),
+    ("🧪 Simulator Reaksi", "lakukan reaksi",
+     lambda at: at.selectbox(key="compound1").select("Besi (Fe)"),
+     lambda at, i: at.button(key="react_button").click()),
+]
+
+
+# Navigasi berbasis session state memakai radio "page"; versi st.tabs tidak punya
+def open_section(at, section):
+    if any(r.key == "page" for r in at.radio):
+        timed_run(at, lambda a: a.radio(key="page").set_value(section))
+
+
+def main():
+    print(f"{'bagian':<22} {'interaksi':<16} {'median':>10} {'delta':>6} {'payload':>10}")
+    for section, name, setup, action in INTERACTIONS:
+        at = new_app()
+        timed_run(at)
+        open_section(at, section)
+        if setup is not None:
+            timed_run(at, setup)
+        timed_run(at, lambda a: action(a, 0))  # pemanasan cache
+
+        times = [timed_run(at, lambda a: action(a, i)) for i in range(1, REPEAT + 1)]
+        deltas, size = payload_stats(at._tree)
+        print(f"{section:<22} {name:<16} {statistics.median(times) * 1e3:>7.1f} ms "
+              f"{deltas:>6} {size / 1024:>6.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+# Jumlah delta dan byte yang dikirim halaman "Tabel Periodik" per rerun
+#
+# Jalankan: python benchmarks/bench_periodic_deltas.py
+from harness import new_app, payload_stats, timed_run
+
+PERIODIC = "📋 Tabel Periodik"
+
+
+def main():
+    at = new_app()
+    timed_run(at)
+    timed_run(at, lambda a: a.radio(key="page").set_value(PERIODIC))
+    deltas, size = payload_stats(at.main)
+    print(f"Tabel Periodik: {deltas} delta, {size / 1024:.1f} KiB")
+
+    for category in ["Halogen", "Logam Transisi"]:
+        timed_run(at, lambda a: a.selectbox(key="category_filter").select(category))
+        deltas, size = payload_stats(at.main)
+        print(f"Filter {category}: {deltas} delta, {size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Benchmark pencarian reaksi: pemindaian linear lama vs indeks hash
+#
+# Jalankan: python benchmarks/bench_reaction_lookup.py
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lab_kimia.reactions import build_reaction_index, find_reaction
+
+SIZES = [18, 100, 1_000, 10_000, 100_000]
+
+
+def make_reactions(n):
+    return [
+        {"reagents": [f"Senyawa {2 * i}", f"Senyawa {2 * i + 1}"], "products": [f"Produk {i}"]}
+        for i in range(n)
+    ]
+
+
+# Cara lama di show_reaction_simulator
+def linear_lookup(reactions, compound1, compound2):
+    for r in reactions:
+        if (compound1 in r["reagents"] and compound2 in r["reagents"]) or \
+           (compound2 in r["reagents"] and compound1 in r["reagents"]):
+            return r
+    return None
+
+
+def best_of(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'reaksi':>8} {'bangun indeks':>14} {'linear':>12} {'indeks':>10} {'indeks (miss)':>14}")
+    for n in SIZES:
+        reactions = make_reactions(n)
+        build = best_of(lambda: build_reaction_index(reactions), 1)
+        index = build_reaction_index(reactions)
+
+        # Kasus terburuk untuk pemindaian linear: reaksi terakhir, urutan terbalik
+        a, b = reactions[-1]["reagents"]
+        number = max(1, 20_000 // n)
+        linear = best_of(lambda: linear_lookup(reactions, b, a), number)
+        hit = best_of(lambda: find_reaction(index, b, a), 100_000)
+        miss = best_of(lambda: find_reaction(index, a, "Tidak Ada"), 100_000)
+
+        assert find_reaction(index, b, a) is reactions[-1]
+        print(f"{n:>8} {build * 1e3:>11.2f} ms {linear * 1e6:>9.1f} µs "
+              f"{hit * 1e9:>7.0f} ns {miss * 1e9:>11.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# Suite benchmark rerun simulasi.py dengan AppTest (headless)
+#
+# Untuk setiap skenario dicatat median waktu rerun, jumlah elemen (delta) dan
+# ukuran payload, lalu dibandingkan dengan baseline tersimpan.
+#
+# Jalankan:
+#     python benchmarks/bench_reruns.py              # bandingkan dengan baseline
+#     python benchmarks/bench_reruns.py --update     # tulis ulang baseline
+#     python benchmarks/bench_reruns.py -k reaksi    # hanya skenario yang cocok
+#
+# Waktu bergantung pada mesin; perbarui baseline saat berganti mesin CI.
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from harness import new_app, payload_stats, timed_run
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# Ambang regresi relatif terhadap baseline
+TIME_THRESHOLD = 0.25
+SIZE_THRESHOLD = 0.10
+
+PERIODIC = "📋 Tabel Periodik"
+SIMULATOR = "🧪 Simulator Reaksi"
+ENCYCLOPEDIA = "📚 Ensiklopedia Kimia"
+SAFETY = "🛡 Penanganan Bahan Kimia"
+
+CATEGORIES = ["Halogen", "Semua"]
+COMPOUNDS = ["Besi (Fe)", "Asam Klorida (HCl)"]
+TRENDS = ["Massa Atom (u)", "Elektronegativitas"]
+
+
+def go_to(section):
+    return lambda at: at.radio(key="page").set_value(section)
+
+
+def rerun(at, i):
+    return at
+
+
+# (nama, langkah persiapan, aksi yang diukur dengan indeks ulangan)
+SCENARIOS = [
+    ("halaman tabel periodik", [], rerun),
+    ("halaman simulator", [go_to(SIMULATOR)], rerun),
+    ("halaman ensiklopedia", [go_to(ENCYCLOPEDIA)], rerun),
+    ("halaman keselamatan", [go_to(SAFETY)], rerun),
+    ("pindah halaman", [],
+     lambda at, i: at.radio(key="page").set_value([ENCYCLOPEDIA, PERIODIC][i % 2])),
+    ("filter kategori", [],
+     lambda at, i: at.selectbox(key="category_filter").select(CATEGORIES[i % 2])),
+    ("sifat tren", [],
+     lambda at, i: at.radio(key="trend_property").set_value(TRENDS[i % 2])),
+    ("pilih senyawa", [go_to(SIMULATOR)],
+     lambda at, i: at.selectbox(key="compound1").select(COMPOUNDS[i % 2])),
+    ("lakukan reaksi", [go_to(SIMULATOR), lambda at: at.selectbox(key="compound1").select("Besi (Fe)")],
+     lambda at, i: at.button(key="react_button").click()),
+]
+
+
+def run_scenario(setup, action, repeat):
+    at = new_app()
+    timed_run(at)
+    for step in setup:
+        timed_run(at, step)
+    timed_run(at, lambda a: action(a, 0))  # pemanasan cache
+
+    times = [timed_run(at, lambda a: action(a, i)) for i in range(1, repeat + 1)]
+    deltas, size = payload_stats(at._tree)
+    return {"time_ms": round(statistics.median(times) * 1e3, 2), "deltas": deltas, "payload_bytes": size}
+
+
+def regressions(result, baseline):
+    found = []
+    if result["time_ms"] > baseline["time_ms"] * (1 + TIME_THRESHOLD):
+        found.append(f"waktu {baseline['time_ms']:.1f} -> {result['time_ms']:.1f} ms")
+    for key in ("deltas", "payload_bytes"):
+        if result[key] > baseline[key] * (1 + SIZE_THRESHOLD):
+            found.append(f"{key} {baseline[key]} -> {result[key]}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rerun simulasi.py")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--update", action="store_true", help="tulis hasil sebagai baseline baru")
+    parser.add_argument("-k", dest="pattern", default="", help="jalankan skenario yang namanya memuat teks ini")
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    results = {}
+    failed = False
+    print(f"{'skenario':<24} {'median':>10} {'delta':>6} {'payload':>10}  status")
+    for name, setup, action in SCENARIOS:
+        if args.pattern not in name:
+            continue
+        result = results[name] = run_scenario(setup, action, args.repeat)
+        if name not in baselines:
+            status = "baru"
+        else:
+            found = regressions(result, baselines[name])
+            failed |= bool(found)
+            status = "REGRESI: " + "; ".join(found) if found else "ok"
+        print(f"{name:<24} {result['time_ms']:>7.1f} ms {result['deltas']:>6} "
+              f"{result['payload_bytes'] / 1024:>6.1f} KiB  {status}")
+
+    if args.update:
+        baselines.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Baseline ditulis ke {BASELINE_PATH}")
+    elif failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# Throughput CLI batch `python -m lab_kimia screen` tanpa I/O disk
+#
+# Jalankan: python benchmarks/bench_screen.py [jumlah_baris]
+import io
+import json
+import random
+import sys
+import time
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.cli import screen_stream
+from lab_kimia.core import get_datasets
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    names = list(get_datasets()[1])
+    rng = random.Random(0)
+    lines = [json.dumps(rng.sample(names, 2), ensure_ascii=False) + "\n" for _ in range(rows)]
+
+    start = time.perf_counter()
+    count = screen_stream(lines, io.StringIO())
+    elapsed = time.perf_counter() - start
+    print(f"{count} pasangan dalam {elapsed:.2f} s ({count / elapsed:,.0f} pasangan/s)")
+
+
+if __name__ == "__main__":
+    main()
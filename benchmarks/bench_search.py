@@ -0,0 +1,49 @@
+# Benchmark latensi pencarian global pada indeks berukuran besar
+#
+# Jalankan: python benchmarks/bench_search.py [jumlah_entri]
+import random
+import statistics
+import sys
+import time
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_datasets
+from lab_kimia.search import SearchEntry, SearchIndex, build_entries
+
+QUERIES = ["H2SO4", "h", "na", "asam sul", "besi", "netralisasi", "reaksi redoks", "c6h", "ok", "zz", "senyawa 4", "kalium 12"]
+
+
+# Entri asli ditambah senyawa sintetis agar indeks mencapai ukuran yang diminta
+def make_entries(n):
+    entries = build_entries(*get_datasets())
+    compounds = list(get_datasets()[1].items())
+    rng = random.Random(0)
+    for i in range(n - len(entries)):
+        name, c = rng.choice(compounds)
+        entries.append(SearchEntry("Senyawa", f"{name.split(' (')[0]} {i}", f"{c['formula']}{i % 97} · {c['type']}", i))
+    return entries
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    entries = make_entries(n)
+    start = time.perf_counter()
+    index = SearchIndex(entries)
+    print(f"{len(entries)} entri, indeks dibangun dalam {time.perf_counter() - start:.2f} s")
+
+    worst = 0.0
+    for query in QUERIES:
+        times = []
+        for _ in range(200):
+            start = time.perf_counter()
+            results = index.search(query)
+            times.append(time.perf_counter() - start)
+        times.sort()
+        worst = max(worst, times[int(len(times) * 0.99)])
+        print(f"{query!r:<16} {len(results):>3} hasil  p50 {statistics.median(times) * 1e6:>7.1f} µs  "
+              f"p99 {times[int(len(times) * 0.99)] * 1e6:>7.1f} µs")
+    print(f"p99 terburuk: {worst * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Benchmark startup: waktu import dingin dan waktu render pertama simulasi.py
+#
+# Setiap pengukuran berjalan di interpreter baru agar cache modul kosong.
+#
+# Jalankan: python benchmarks/bench_startup.py [--repeat 5] [--output hasil.json]
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+
+from harness import APP_PATH, ROOT
+
+# Pustaka berat yang seharusnya baru dimuat saat dibutuhkan
+HEAVY_MODULES = ["pandas", "plotly.express", "plotly.graph_objects", "numpy", "PIL.Image"]
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+{imports}
+print(time.perf_counter() - start)
+"""
+
+RENDER_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+elapsed = time.perf_counter() - start
+assert not at.exception, at.exception
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+# Baris import tingkat atas simulasi.py, persis seperti yang dieksekusi saat start
+def top_level_imports():
+    with open(APP_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def run_snippet(code):
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup simulasi.py")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="simpan hasil sebagai JSON untuk dibandingkan antar rilis")
+    args = parser.parse_args()
+
+    imports = top_level_imports()
+    import_code = IMPORT_SNIPPET.format(imports="\n".join(imports))
+    render_code = RENDER_SNIPPET.format(root=ROOT, app=APP_PATH, heavy=HEAVY_MODULES)
+
+    import_times = [float(run_snippet(import_code)) for _ in range(args.repeat)]
+    renders = [json.loads(run_snippet(render_code)) for _ in range(args.repeat)]
+
+    results = {
+        "imports": imports,
+        "cold_import_s": statistics.median(import_times),
+        "first_render_s": statistics.median(r["elapsed"] for r in renders),
+        "heavy_loaded_after_first_render": renders[-1]["loaded"],
+    }
+    print(f"Import tingkat atas : {len(imports)} pernyataan")
+    print(f"Import dingin       : {results['cold_import_s'] * 1e3:.0f} ms (median {args.repeat}x)")
+    print(f"Render pertama      : {results['first_render_s'] * 1e3:.0f} ms (median {args.repeat}x)")
+    print(f"Pustaka berat dimuat: {', '.join(results['heavy_loaded_after_first_render']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
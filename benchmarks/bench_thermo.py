@@ -0,0 +1,62 @@
+# Benchmark termokimia: membangun Thermochemistry (urai persamaan + matriks
+# jarang) dan ΔH semua reaksi sekaligus, vs penjumlahan ΔHf° per reaksi dalam
+# loop Python. Cache urai dikosongkan sebelum setiap pengukuran.
+#
+# Jalankan: python benchmarks/bench_thermo.py [jumlah_reaksi]
+import sys
+import time
+import timeit
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.balance import parse_equation, parse_term
+from lab_kimia.core import get_datasets
+from lab_kimia.thermo import FORMATION_ENTHALPY, Thermochemistry
+
+
+# Reaksi asli diulang sampai n. unique=True mengubah koefisien pereaksi pertama
+# agar setiap persamaan unik (cache per persamaan tidak membantu).
+def make_reactions(n, unique=True):
+    base = get_datasets()[2]
+    prefix = (lambda i: str(i // len(base) + 1)) if unique else (lambda i: "")
+    return [{"equation": f"{prefix(i)}{base[i % len(base)]['equation']}"} for i in range(n)]
+
+
+def looped(reactions):
+    result = []
+    for r in reactions:
+        reactants, products = parse_equation(r["equation"])
+        result.append(sum(c * FORMATION_ENTHALPY[f][0] for c, f in products)
+                      - sum(c * FORMATION_ENTHALPY[f][0] for c, f in reactants))
+    return result
+
+
+def cold(fn):
+    parse_equation.cache_clear()
+    parse_term.cache_clear()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for unique in (True, False):
+        reactions = make_reactions(n, unique)
+        thermo, build = cold(lambda: Thermochemistry(reactions))
+        product = min(timeit.repeat(lambda: thermo.enthalpies(thermo.formation), number=10, repeat=3)) / 10
+        expected, loop = cold(lambda: looped(reactions))
+        error = max(abs(thermo.enthalpy[thermo.index[r["equation"]]] - e) for r, e in zip(reactions, expected))
+        print(f"{n:,} reaksi {'unik' if unique else 'berulang'} x {len(thermo.species)} spesi: "
+              f"bangun {build * 1e3:.1f} ms (ΔH semua reaksi {product * 1e3:.2f} ms), "
+              f"loop Python {loop * 1e3:.1f} ms, {len(thermo.values):,} suku, selisih maks {error:.1e} kJ")
+
+    _, build = cold(lambda: Thermochemistry(get_datasets()[2]))
+    print(f"dataset asli ({len(get_datasets()[2])} reaksi): dihitung sekali saat dimuat dalam {build * 1e3:.2f} ms")
+
+    equation = reactions[0]["equation"]
+    lookup = min(timeit.repeat(lambda: thermo.enthalpy_of(equation), number=10000, repeat=5)) / 10000
+    print(f"ΔH satu reaksi dari tabel: {lookup * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Benchmark kurva titrasi: bisection tervektorisasi untuk semua titik volume
+# vs bisection satu titik per satu, serta semua pasangan asam-basa dari cache
+#
+# Jalankan: python benchmarks/bench_titration.py
+import time
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_titration_compounds, titration
+from lab_kimia.titration import titration_curve
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    for points in (10_001, 100_001):
+        vectorized = timed(lambda: titration_curve("CH₃COOH", "NaOH", 0.1, 0.1, points=points))
+        print(f"{points:>7,} titik volume: {vectorized * 1e3:7.1f} ms")
+
+    # Kurva yang sama dengan satu panggilan per titik (100 titik, lalu diskalakan)
+    single = timed(lambda: [titration_curve("CH₃COOH", "NaOH", 0.1, 0.1, points=1) for _ in range(100)]) / 100
+    print(f"satu titik per satu: {single * 1e3:.2f} ms/titik, ~{single * 10_001:.1f} s untuk 10.001 titik")
+
+    acids, bases = get_titration_compounds()
+    pairs = [(a, b) for a in acids for b in bases]
+    titration.cache_clear()
+    cold = timed(lambda: [titration(a, b, 0.1, 0.1) for a, b in pairs])
+    warm = timed(lambda: [titration(a, b, 0.1, 0.1) for a, b in pairs])
+    print(f"{len(pairs)} pasangan: pertama {cold * 1e3:.1f} ms, dari cache {warm * 1e6:.1f} µs")
+
+    curve = titration(acids[0], bases[0], 0.1, 0.1)
+    volume, ph = curve["equivalence"][0]
+    print(f"{acids[0]} + {bases[0]}: titik ekuivalen {volume:.2f} mL, pH {ph:.2f} "
+          f"(pH awal {curve['ph'][0]:.2f}, akhir {curve['ph'][-1]:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Benchmark heatmap tren periodik: array 2-D sifat dari ElementStore, lalu
+# restyle salinan kerangka heatmap vs membangun figure baru dari daftar unsur
+#
+# Jalankan: python benchmarks/bench_trends.py
+import timeit
+
+import plotly.graph_objects as go
+
+import harness  # noqa: F401  (menaruh root repo di sys.path)
+from lab_kimia.core import get_datasets, get_element_store
+from lab_kimia.elements import ElementStore, grid_position
+
+
+def best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+# Cara naif: susun grid dari daftar dict dan bangun figure lengkap setiap kali
+def rebuild(table, field, category):
+    z = [[None] * 18 for _ in range(7)]
+    text = [[""] * 18 for _ in range(7)]
+    for e in table:
+        column, row = grid_position(e)
+        text[row - 1][column - 1] = e["Symbol"]
+        if category is None or e["Category"] == category:
+            z[row - 1][column - 1] = e[field]
+    fig = go.Figure(go.Heatmap(z=z, text=text, texttemplate="%{text}", colorscale="Viridis", xgap=3, ygap=3))
+    fig.update_yaxes(autorange="reversed", scaleanchor="x")
+    fig.update_layout(template="plotly_white", title=f"Tren {field}")
+    return fig
+
+
+def main():
+    table = get_datasets()[0]
+    store = get_element_store()
+    print(f"{len(table)} unsur, grid {store.grid_shape[0]}x{store.grid_shape[1]}, sifat: {', '.join(store.trend_fields)}")
+
+    cold = best(lambda: ElementStore(table).trend_grid("Electronegativity"), 20)
+    print(f"array sifat pertama (termasuk membangun store): {cold * 1e3:.2f} ms")
+    print(f"array sifat dari cache : {best(lambda: store.trend_grid('Electronegativity'), 10_000) * 1e6:.2f} µs")
+    print(f"dengan mask kategori   : {best(lambda: store.trend_grid('Electronegativity', 'Halogen'), 10_000) * 1e6:.2f} µs")
+
+    base = rebuild(table, "Electronegativity", None)
+
+    def restyle():
+        fig = go.Figure(base)
+        fig.update_traces(z=store.trend_grid("AtomicMass", "Halogen"))
+        fig.update_layout(title="Tren AtomicMass")
+        return fig
+
+    print(f"figure baru dari daftar unsur: {best(lambda: rebuild(table, 'AtomicMass', 'Halogen'), 20) * 1e3:.2f} ms")
+    print(f"restyle salinan kerangka     : {best(restyle, 20) * 1e3:.2f} ms "
+          "(sekali per sifat dan kategori; selanjutnya dari st.cache_resource)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Alat bantu benchmark: menjalankan simulasi.py secara headless dengan AppTest
+# dan menghitung jumlah delta serta ukuran payload yang dikirim ke frontend
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "simulasi.py")
+
+# `streamlit run` menaruh folder skrip di sys.path; AppTest tidak
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def new_app(timeout=60):
+    from streamlit.testing.v1 import AppTest
+
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+# Setiap blok dan elemen di pohon hasil adalah satu delta ke frontend
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def payload_stats(node):
+    deltas = 0
+    size = 0
+    for n in walk(node):
+        proto = getattr(n, "proto", None)
+        if proto is None:
+            continue
+        deltas += 1
+        size += proto.ByteSize()
+    return deltas, size
+
+
+# Menjalankan satu interaksi dan mengukur waktu rerun di server
+def timed_run(at, action=None):
+    start = time.perf_counter()
+    if action is None:
+        at.run()
+    else:
+        action(at).run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
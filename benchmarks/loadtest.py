@@ -0,0 +1,288 @@
+# Uji beban multi-sesi: banyak "kelas" membuka aplikasi bersamaan
+#
+# Menjalankan server (loadtest_server.py, setara `streamlit run simulasi.py`),
+# membuka banyak sesi websocket yang berbicara dengan protokol Streamlit
+# (BackMsg/ForwardMsg), lalu memutar ulang interaksi realistis: pindah halaman,
+# mengganti filter kategori, memilih senyawa dan melakukan reaksi. Hasilnya:
+# persentil latensi rerun per jenis aksi, CPU server, serta pertumbuhan memori
+# per sesi (RSS server dan ukuran st.session_state).
+#
+# Jalankan: python benchmarks/loadtest.py --sessions 100 --actions 20
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from tornado.websocket import websocket_connect
+
+from harness import ROOT
+from lab_kimia.core import get_datasets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# Jenis widget yang dipakai skrip interaksi dan field nilainya di WidgetState
+VALUE_FIELDS = {"radio": "int_value", "selectbox": "int_value", "button": "trigger_value"}
+
+# Bobot aksi; aksi hanya dipilih jika widgetnya ada di halaman saat ini
+ACTIONS = {"pindah halaman": 3, "filter kategori": 3, "pilih senyawa": 3, "lakukan reaksi": 2}
+
+
+class Session:
+    def __init__(self, url, rng, reactions):
+        self.url = url
+        self.rng = rng
+        self.reactions = reactions
+        self.widgets = {}  # kunci pengguna -> (jenis, id, opsi, id fragmen)
+        self.states = {}  # id widget -> WidgetState yang dikirim seperti browser
+        self.by_hash = {}  # hash ForwardMsg -> widget, untuk pesan referensi ref_hash
+        self.latencies = []  # (aksi, detik)
+        self.errors = 0
+        self.page_script_hash = ""
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, subprotocols=["streamlit"], max_message_size=64 * 2**20)
+        await self.rerun("muat awal", [])
+
+    def close(self):
+        self.ws.close()
+
+    # Kirim rerun_script dengan state semua widget lalu tunggu script_finished.
+    # Seperti browser, widget di dalam fragmen hanya menjalankan ulang fragmennya.
+    async def rerun(self, action, triggers, fragment_id=""):
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(list(self.states.values()) + triggers)
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        seen = {}
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("server menutup websocket")
+            forward = ForwardMsg.FromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "new_session":
+                self.page_script_hash = forward.new_session.page_script_hash
+            elif kind == "delta":
+                self._record_widget(forward, seen)
+            elif kind == "ref_hash" and forward.ref_hash in self.by_hash:
+                key, widget = self.by_hash[forward.ref_hash]
+                seen[key] = widget
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                break
+        self.latencies.append((action, time.perf_counter() - start))
+
+        # Seperti browser: hanya widget yang masih tampil yang statenya dikirim lagi.
+        # Rerun fragmen hanya mengganti widget milik fragmen itu.
+        if fragment_id:
+            seen = {**{k: w for k, w in self.widgets.items() if w[3] != fragment_id}, **seen}
+        self.widgets = seen
+        ids = {widget[1] for widget in seen.values()}
+        self.states = {wid: state for wid, state in self.states.items() if wid in ids}
+
+    def _record_widget(self, forward, seen):
+        element = forward.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.errors += 1
+        if kind not in VALUE_FIELDS:
+            return
+        proto = getattr(element, kind)
+        key = proto.id.split("-", 2)[-1]
+        widget = (kind, proto.id, tuple(getattr(proto, "options", ())), getattr(forward.delta, "fragment_id", ""))
+        seen[key] = widget
+        if forward.hash:
+            self.by_hash[forward.hash] = (key, widget)
+
+    def _set(self, key, index):
+        wid = self.widgets[key][1]
+        state = WidgetState(id=wid, int_value=index)
+        self.states[wid] = state
+
+    def _index(self, key, value):
+        return self.widgets[key][2].index(value)
+
+    def fragment_of(self, key):
+        return self.widgets[key][3]
+
+    # Satu aksi acak yang mungkin dilakukan di halaman saat ini
+    async def act(self):
+        available = {"pindah halaman": "page", "filter kategori": "category_filter",
+                     "pilih senyawa": "compound1", "lakukan reaksi": "react_button"}
+        choices = [a for a, key in available.items() if key in self.widgets]
+        action = self.rng.choices(choices, weights=[ACTIONS[a] for a in choices])[0]
+        triggers = []
+        fragment_id = ""
+        if action == "pindah halaman":
+            self._set("page", self.rng.randrange(len(self.widgets["page"][2])))
+        elif action == "filter kategori":
+            self._set("category_filter", self.rng.randrange(len(self.widgets["category_filter"][2])))
+        elif action == "pilih senyawa":
+            for key in ("compound1", "compound2"):
+                self._set(key, self.rng.randrange(len(self.widgets[key][2])))
+            fragment_id = self.fragment_of("compound1")
+        else:
+            # Separuh percobaan memakai pasangan yang memang bereaksi
+            reaction = self.rng.choice(self.reactions)
+            options = self.widgets["compound1"][2]
+            if self.rng.random() < 0.5 and all(r in options for r in reaction["reagents"]):
+                self._set("compound1", self._index("compound1", reaction["reagents"][0]))
+                self._set("compound2", self._index("compound2", reaction["reagents"][1]))
+            triggers.append(WidgetState(id=self.widgets["react_button"][1], trigger_value=True))
+            fragment_id = self.fragment_of("react_button")
+        await self.rerun(action, triggers, fragment_id)
+
+
+async def run_session(url, index, args, reactions, ready):
+    rng = random.Random(args.seed * 100_003 + index)
+    await asyncio.sleep(args.ramp * index / max(args.sessions, 1))
+    session = Session(url, rng, reactions)
+    await session.connect()
+    ready.release()
+    for _ in range(args.actions):
+        await asyncio.sleep(rng.expovariate(1 / args.think) if args.think else 0)
+        await session.act()
+    return session
+
+
+def read_stats(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def wait_until_healthy(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server tidak siap dalam {timeout} s")
+
+
+def percentile(ordered, q):
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)] * 1e3
+
+
+def percentiles(values):
+    ordered = sorted(values)
+    return (f"p50 {percentile(ordered, 0.50):7.1f}  p90 {percentile(ordered, 0.90):7.1f}  "
+            f"p99 {percentile(ordered, 0.99):7.1f}  maks {ordered[-1] * 1e3:7.1f} ms")
+
+
+# Satu sesi pemanasan membuka setiap halaman sekali agar impor dan cache proses
+# tidak terhitung sebagai memori per sesi
+async def warm_up(url, reactions):
+    session = Session(url, random.Random(0), reactions)
+    await session.connect()
+    for index in range(len(session.widgets["page"][2])):
+        session._set("page", index)
+        await session.rerun("pemanasan", [])
+    session.close()
+
+
+async def load(args, port):
+    url = f"ws://localhost:{port}/_stcore/stream"
+    reactions = get_datasets()[2]
+    ready = asyncio.Semaphore(0)
+    tasks = [asyncio.ensure_future(run_session(url, i, args, reactions, ready)) for i in range(args.sessions)]
+    for _ in range(args.sessions):
+        await ready.acquire()
+    connected = time.time()
+    results = await asyncio.gather(*tasks)
+    finished = time.time()
+    # Tunggu satu sampel statistik server lagi sebelum menutup sesi
+    await asyncio.sleep(0.6)
+    for session in results:
+        session.close()
+    return results, connected, finished
+
+
+def report(results, samples, started, connected, finished):
+    print(f"\n{len(results)} sesi, {sum(len(s.latencies) for s in results)} rerun, "
+          f"{sum(s.errors for s in results)} exception di aplikasi")
+
+    by_action = {}
+    for session in results:
+        for action, seconds in session.latencies:
+            by_action.setdefault(action, []).append(seconds)
+    print("\nLatensi rerun (kirim BackMsg -> script_finished):")
+    for action, values in by_action.items():
+        print(f"  {action:<16} n={len(values):<6} {percentiles(values)}")
+    print(f"  {'semua aksi':<16} n={sum(len(v) for v in by_action.values()):<6} "
+          f"{percentiles([v for values in by_action.values() for v in values])}")
+
+    before = [s for s in samples if s["time"] <= started][-1]
+    at_connect = min((s for s in samples if s["time"] >= connected), key=lambda s: s["time"], default=samples[-1])
+    end = [s for s in samples if s["time"] <= finished][-1]
+    during = [s for s in samples if started <= s["time"] <= finished]
+
+    cpu_seconds = end["cpu"] - before["cpu"]
+    wall = end["time"] - before["time"]
+    peaks = [(b["cpu"] - a["cpu"]) / (b["time"] - a["time"]) for a, b in zip(during, during[1:]) if b["time"] > a["time"]]
+    print("\nCPU server:")
+    print(f"  rata-rata {cpu_seconds / wall * 100:6.1f}% satu inti, puncak {max(peaks, default=0) * 100:6.1f}% "
+          f"({cpu_seconds:.1f} s CPU dalam {wall:.1f} s)")
+
+    n = max(len(results), 1)
+    print("\nMemori server (RSS):")
+    print(f"  sebelum {before['rss'] / 2**20:7.1f} MiB, semua sesi terhubung {at_connect['rss'] / 2**20:7.1f} MiB, "
+          f"akhir {end['rss'] / 2**20:7.1f} MiB, puncak {max(s['rss'] for s in during) / 2**20:7.1f} MiB")
+    print(f"  per sesi: {(at_connect['rss'] - before['rss']) / n / 1024:7.1f} KiB saat terhubung, "
+          f"{(end['rss'] - at_connect['rss']) / n / 1024:7.1f} KiB pertumbuhan selama interaksi")
+
+    sizes = end["sessions"]
+    if sizes:
+        start_sizes = at_connect["sessions"] or [0]
+        print("\nst.session_state per sesi (ukuran pickle):")
+        print(f"  awal rata-rata {statistics.mean(start_sizes) / 1024:6.2f} KiB, akhir rata-rata "
+              f"{statistics.mean(sizes) / 1024:6.2f} KiB, maks {max(sizes) / 1024:6.2f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uji beban multi-sesi untuk simulasi.py")
+    parser.add_argument("--sessions", type=int, default=50, help="jumlah sesi bersamaan (mis. 50-200)")
+    parser.add_argument("--actions", type=int, default=20, help="jumlah aksi per sesi")
+    parser.add_argument("--think", type=float, default=1.0, help="rata-rata jeda antaraksi per sesi (detik)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="waktu untuk membuka semua sesi (detik)")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_path = os.path.join(tmp, "server_stats.jsonl")
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "benchmarks", "loadtest_server.py"), stats_path, str(args.port)],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_healthy(args.port)
+            asyncio.run(warm_up(f"ws://localhost:{args.port}/_stcore/stream", get_datasets()[2]))
+            time.sleep(1.0)
+            started = time.time()
+            print(f"{args.sessions} sesi x {args.actions} aksi terhadap http://localhost:{args.port} ...")
+            results, connected, finished = asyncio.run(load(args, args.port))
+            samples = read_stats(stats_path)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+    report(results, samples, started, connected, finished)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Peluncur server untuk uji beban: setara `streamlit run simulasi.py`, ditambah
+# thread yang menulis statistik proses server ke berkas JSONL secara berkala:
+# waktu CPU, RSS, dan ukuran st.session_state setiap sesi aktif.
+#
+# Dipanggil oleh benchmarks/loadtest.py dan benchmarks/bench_clicks.py:
+#     python benchmarks/loadtest_server.py <berkas_statistik> <port> [simulasi.py lain]
+import json
+import os
+import pickle
+import resource
+import sys
+import threading
+import time
+
+from harness import APP_PATH
+
+INTERVAL = 0.5
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Bukan Linux: hanya RSS puncak yang tersedia
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# Perkiraan ukuran session_state: ukuran pickle tiap nilai (getsizeof jika tidak bisa di-pickle)
+def state_bytes(state):
+    total = 0
+    for value in list(state.filtered_state.values()):
+        try:
+            total += len(pickle.dumps(value))
+        except Exception:
+            total += sys.getsizeof(value)
+    return total
+
+
+def session_sizes():
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return []
+    sizes = []
+    for info in Runtime.instance()._session_mgr.list_active_sessions():
+        try:
+            sizes.append(state_bytes(info.session.session_state))
+        except RuntimeError:
+            # State sedang diubah oleh thread skrip; lewati sesi ini untuk sampel ini
+            continue
+    return sizes
+
+
+def report_stats(path):
+    with open(path, "a", encoding="utf-8") as out:
+        while True:
+            sample = {"time": time.time(), "cpu": time.process_time(), "rss": rss_bytes(), "sessions": session_sizes()}
+            out.write(json.dumps(sample) + "\n")
+            out.flush()
+            time.sleep(INTERVAL)
+
+
+def main():
+    from streamlit.web import bootstrap
+
+    stats_path, port = sys.argv[1], int(sys.argv[2])
+    app_path = sys.argv[3] if len(sys.argv) > 3 else APP_PATH
+    flags = {
+        "server_port": port,
+        "server_headless": True,
+        "server_fileWatcherType": "none",
+        "browser_gatherUsageStats": False,
+    }
+    bootstrap.load_config_options(flags)
+    threading.Thread(target=report_stats, args=(stats_path,), daemon=True).start()
+    bootstrap.run(app_path, False, [], flags)
+
+
+if __name__ == "__main__":
+    main()
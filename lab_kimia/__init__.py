@@ -0,0 +1 @@
+# Logika kimia Laboratorium Kimia Interaktif yang tidak bergantung pada Streamlit
@@ -0,0 +1,3 @@
+from lab_kimia.cli import main
+
+main()
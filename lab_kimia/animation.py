@@ -0,0 +1,86 @@
+# Animasi gelas kimia (GIF) dari warna pereaksi ke warna produk
+#
+# Seluruh frame dihitung sekaligus dengan NumPy: warna setiap baris cairan
+# diinterpolasi dalam ruang linear untuk semua frame, lalu permukaan cairan
+# diberi gelombang selama pencampuran. PIL hanya dipakai untuk menggambar
+# bentuk gelas sekali dan menyandikan GIF.
+import io
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from lab_kimia.colors import hex_to_rgb, to_linear, to_srgb
+
+# Naikkan jika tampilan animasi berubah agar entri cache lama tidak dipakai
+RENDER_VERSION = 1
+
+SIZE = (200, 240)
+FRAMES = 24
+FRAME_MS = 80
+HOLD_MS = 700
+WAVE_HEIGHT = 4
+
+BACKGROUND = (248, 249, 250)
+GLASS = (90, 110, 120)
+
+
+# Mask gelas (dinding) dan bagian dalam gelas untuk ukuran tertentu
+def _beaker_masks(width, height):
+    left, right = int(width * 0.2), int(width * 0.8)
+    top, bottom = int(height * 0.12), int(height * 0.92)
+    wall = max(width // 50, 2)
+
+    # Hanya sudut bawah yang membulat; tepi atas dibiarkan terbuka
+    corners = (False, False, True, True)
+    inner = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(inner).rounded_rectangle((left, top, right, bottom), radius=wall * 6, fill=255, corners=corners)
+    glass = Image.new("L", (width, height), 0)
+    draw = ImageDraw.Draw(glass)
+    draw.rounded_rectangle((left, top, right, bottom), radius=wall * 6, outline=255, width=wall, corners=corners)
+    draw.line((left + wall, top, right - wall, top), fill=0, width=wall * 2)
+    # Bibir gelas
+    draw.line((left - wall * 3, top, left + wall - 1, top), fill=255, width=wall)
+    draw.line((right - wall + 1, top, right + wall * 3, top), fill=255, width=wall)
+    return np.asarray(glass) > 0, np.asarray(inner) > 0, top, bottom
+
+
+# Warna per baris cairan: lapisan horizontal sama tebal, satu per warna
+def _layer_rows(colors, rows):
+    linear = to_linear(hex_to_rgb(colors))
+    return linear[np.arange(rows) * len(colors) // rows]
+
+
+# Fungsi untuk merender animasi GIF; hasil berupa bytes
+def render_beaker_gif(reagent_colors, product_colors, size=SIZE, frames=FRAMES):
+    width, height = size
+    glass, inner, top, bottom = _beaker_masks(width, height)
+    surface = top + int((bottom - top) * 0.3)
+    # Baris warna dimulai di atas permukaan agar puncak gelombang ikut berwarna
+    first = surface - WAVE_HEIGHT - 1
+    rows = bottom - first
+
+    # Kemajuan t per frame dengan easing halus, lalu warna semua frame sekaligus: (F, baris, 3)
+    t = np.linspace(0.0, 1.0, frames)
+    eased = t * t * (3 - 2 * t)
+    start, end = _layer_rows(reagent_colors, rows), _layer_rows(product_colors, rows)
+    colors = to_srgb(start + (end - start) * eased[:, None, None])
+    liquid_rows = np.zeros((frames, height, 3), dtype=np.uint8)
+    liquid_rows[:, first:bottom] = np.rint(colors * 255).astype(np.uint8)
+
+    # Gelombang permukaan, terbesar di tengah pencampuran: (F, W)
+    x = np.arange(width)
+    amplitude = WAVE_HEIGHT * np.sin(np.pi * t)
+    waves = surface + amplitude[:, None] * np.sin(2 * np.pi * (x[None, :] / width * 1.5 + t[:, None] * 2))
+    y = np.arange(height)
+    liquid = inner[None] & (y[None, :, None] >= waves[:, None, :])
+
+    video = np.empty((frames, height, width, 3), dtype=np.uint8)
+    video[:] = BACKGROUND
+    video = np.where(liquid[..., None], liquid_rows[:, :, None, :], video)
+    video[:, glass] = GLASS
+
+    images = [Image.fromarray(frame).convert("P", palette=Image.ADAPTIVE, colors=64) for frame in video]
+    durations = [HOLD_MS] + [FRAME_MS] * (frames - 2) + [HOLD_MS * 2]
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="GIF", save_all=True, append_images=images[1:], duration=durations, loop=0)
+    return buffer.getvalue()
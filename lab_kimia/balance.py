@@ -0,0 +1,154 @@
+# Penyetaraan dan validasi persamaan reaksi dengan aljabar linear
+#
+# Setiap persamaan diubah menjadi matriks unsur x spesi (pereaksi positif,
+# produk negatif). Persamaan setara jika matriks dikali koefisien = 0; koefisien
+# bulat terkecil diperoleh dari ruang nol matriks tersebut.
+import math
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from lab_kimia.formula import parse_formula
+
+ARROW = re.compile(r"\s*(?:→|->|=)\s*")
+SPECIES = re.compile(r"^\s*(\d*)\s*(.+?)\s*$")
+
+# Rumus di akhir nama senyawa, misalnya "Timbal Nitrat (Pb(NO₃)₂)" -> "Pb(NO₃)₂"
+NAME_FORMULA = re.compile(r"\((.*)\)\s*$")
+
+
+# Fungsi untuk memecah satu suku "2HCl" menjadi (koefisien, rumus); None jika
+# kosong. Suku yang sama muncul di banyak persamaan, sehingga hasilnya di-cache.
+@lru_cache(maxsize=65536)
+def parse_term(term):
+    match = SPECIES.match(term)
+    if not match:
+        return None
+    return int(match.group(1) or 1), match.group(2)
+
+
+# Fungsi untuk memecah persamaan menjadi tuple (koefisien, rumus) per sisi;
+# hasil di-cache per string persamaan seperti check_equation
+@lru_cache(maxsize=4096)
+def parse_equation(equation):
+    sides = ARROW.split(equation)
+    if len(sides) != 2:
+        raise ValueError(f"persamaan harus memiliki tepat satu tanda panah: {equation!r}")
+    parsed = []
+    for side in sides:
+        species = tuple(map(parse_term, side.split(" + ")))
+        if None in species:
+            raise ValueError(f"spesi kosong dalam persamaan {equation!r}")
+        parsed.append(species)
+    return parsed[0], parsed[1]
+
+
+def element_matrix(reactants, products):
+    formulas = reactants + products
+    counts = [parse_formula(f) for f in formulas]
+    elements = sorted({e for c in counts for e in c})
+    matrix = np.zeros((len(elements), len(formulas)), dtype=np.float64)
+    for j, c in enumerate(counts):
+        sign = 1 if j < len(reactants) else -1
+        for element, n in c.items():
+            matrix[elements.index(element), j] = sign * n
+    return elements, matrix
+
+
+# Fungsi untuk mencari koefisien bulat positif terkecil; None jika tidak ada
+# solusi tunggal (ruang nol berdimensi selain 1 atau koefisien tidak positif)
+def smallest_coefficients(matrix):
+    _, singular, vh = np.linalg.svd(matrix)
+    rank = int((singular > 1e-9 * max(singular.max(initial=0), 1)).sum())
+    if matrix.shape[1] - rank != 1:
+        return None
+    vector = vh[-1] / vh[-1][np.argmax(np.abs(vh[-1]))]
+    if np.any(vector <= 1e-9):
+        return None
+    fractions = [Fraction(float(v)).limit_denominator(1000) for v in vector]
+    scale = math.lcm(*(f.denominator for f in fractions))
+    integers = [int(f * scale) for f in fractions]
+    divisor = math.gcd(*integers)
+    return tuple(i // divisor for i in integers)
+
+
+# Fungsi untuk memeriksa satu persamaan; hasil di-cache per string persamaan
+@lru_cache(maxsize=4096)
+def check_equation(equation):
+    reactants, products = parse_equation(equation)
+    formulas = [f for _, f in reactants + products]
+    given = np.array([c for c, _ in reactants + products], dtype=np.float64)
+    elements, matrix = element_matrix([f for _, f in reactants], [f for _, f in products])
+    residual = matrix @ given
+    suggested = smallest_coefficients(matrix)
+    return {
+        "equation": equation,
+        "balanced": bool(np.all(residual == 0)),
+        "coefficients": tuple(int(c) for c in given),
+        "suggested": suggested,
+        "unbalanced_elements": [e for e, r in zip(elements, residual) if r != 0],
+        "formulas": formulas,
+    }
+
+
+def balanced_equation(reactants, products, coefficients):
+    terms = [f"{c if c != 1 else ''}{f}" for c, f in zip(coefficients, reactants + products)]
+    return f"{' + '.join(terms[:len(reactants)])} → {' + '.join(terms[len(reactants):])}"
+
+
+def name_formula(name, compounds):
+    if name in compounds:
+        return compounds[name]["formula"]
+    match = NAME_FORMULA.search(name)
+    return match.group(1) if match else None
+
+
+def _species_key(formula):
+    return tuple(sorted(parse_formula(formula).items()))
+
+
+# Fungsi untuk memvalidasi seluruh REACTIONS sekaligus: kesetaraan persamaan dan
+# kecocokan spesi dalam persamaan dengan daftar reagents/products
+def validate_reactions(reactions, compounds):
+    reports = []
+    for index, reaction in enumerate(reactions):
+        report = {"index": index, "equation": reaction["equation"], "problems": []}
+        try:
+            result = check_equation(reaction["equation"])
+        except ValueError as exc:
+            report["problems"].append(str(exc))
+            reports.append(report)
+            continue
+        report.update(result)
+
+        if not result["balanced"]:
+            problem = f"tidak setara pada unsur {', '.join(result['unbalanced_elements'])}"
+            if result["suggested"]:
+                reactants, products = parse_equation(reaction["equation"])
+                problem += "; usulan: " + balanced_equation(
+                    [f for _, f in reactants], [f for _, f in products], result["suggested"])
+            else:
+                problem += "; tidak ada penyetaraan tunggal"
+            report["problems"].append(problem)
+
+        reactants, products = parse_equation(reaction["equation"])
+        for side, listed, species in (("pereaksi", reaction["reagents"], reactants),
+                                      ("produk", reaction["products"], products)):
+            in_equation = {_species_key(f): f for _, f in species}
+            in_list = {}
+            for name in listed:
+                formula = name_formula(name, compounds)
+                if formula is None:
+                    report["problems"].append(f"rumus {side} {name!r} tidak diketahui")
+                else:
+                    in_list[_species_key(formula)] = name
+            missing = [in_equation[k] for k in in_equation if k not in in_list]
+            extra = [in_list[k] for k in in_list if k not in in_equation]
+            if missing:
+                report["problems"].append(f"{side} di persamaan tidak ada di daftar: {', '.join(missing)}")
+            if extra:
+                report["problems"].append(f"{side} di daftar tidak ada di persamaan: {', '.join(extra)}")
+        reports.append(report)
+    return reports
@@ -0,0 +1,129 @@
+# Antarmuka baris perintah untuk pemrosesan batch tanpa Streamlit
+#
+#     python -m lab_kimia screen pasangan.jsonl -o hasil.jsonl
+#     python -m lab_kimia audit inventaris.csv -o pelanggaran.csv
+#
+# Setiap baris masukan adalah array JSON ["Senyawa A", "Senyawa B"] atau objek
+# {"compound1": ..., "compound2": ...}; setiap baris keluaran adalah hasil
+# screen_pair dalam JSON.
+import argparse
+import json
+import sys
+import time
+
+from lab_kimia.balance import validate_reactions
+from lab_kimia.core import get_compatibility_engine, get_datasets, get_inventory_aliases, screen_pair
+
+# Batas jumlah hasil terserialisasi yang disimpan agar memori tetap terbatas
+MAX_RENDERED = 65536
+
+
+def parse_pair(line):
+    pair = json.loads(line)
+    if isinstance(pair, dict):
+        return pair["compound1"], pair["compound2"]
+    compound1, compound2 = pair
+    if not isinstance(compound1, str) or not isinstance(compound2, str):
+        raise ValueError("nama senyawa harus berupa teks")
+    return compound1, compound2
+
+
+# Fungsi untuk menyaring aliran JSONL baris demi baris dengan memori tetap.
+# Hasil per pasangan diserialisasi sekali lalu dipakai ulang untuk baris berikutnya.
+# Baris yang rusak dilewati dengan peringatan di stderr, tanpa menghentikan aliran.
+def screen_stream(lines, out, errors=sys.stderr):
+    rendered = {}
+    count = 0
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            pair = parse_pair(line)
+            text = rendered.get(pair)
+            if text is None:
+                text = json.dumps(screen_pair(*pair), ensure_ascii=False) + "\n"
+                if len(rendered) < MAX_RENDERED:
+                    rendered[pair] = text
+        except (ValueError, KeyError, TypeError) as exc:
+            print(f"baris {number} dilewati: {type(exc).__name__}: {exc}", file=errors)
+            continue
+        out.write(text)
+        count += 1
+    return count
+
+
+def cmd_screen(args):
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        count = screen_stream(source, out)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"{count} pasangan dalam {elapsed:.2f} s ({count / max(elapsed, 1e-9):,.0f}/s)", file=sys.stderr)
+
+
+def cmd_validate(args):
+    _, compounds, reactions = get_datasets()
+    reports = validate_reactions(reactions, compounds)
+    problems = 0
+    for report in reports:
+        status = "OK" if not report["problems"] else "MASALAH"
+        print(f"[{status}] Reaksi {report['index'] + 1}: {report['equation']}")
+        for problem in report["problems"]:
+            print(f"    - {problem}")
+        problems += bool(report["problems"])
+    print(f"{len(reports)} reaksi diperiksa, {problems} bermasalah", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+def cmd_audit(args):
+    from lab_kimia.inventory import audit_inventory, report_csv
+
+    start = time.perf_counter()
+    report = audit_inventory(args.input, get_compatibility_engine(), chunk_rows=args.chunk_rows,
+                             aliases=get_inventory_aliases())
+    data = report_csv(report)
+    if args.output == "-":
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        with open(args.output, "wb") as out:
+            out.write(data)
+    elapsed = time.perf_counter() - start
+    print(f"{report['rows']} baris, {report['locations']} lokasi, {len(report['violations'])} pelanggaran, "
+          f"{report['unknown_rows']} baris senyawa tidak dikenal, {report['unlocated_rows']} baris tanpa lokasi "
+          f"dalam {elapsed:.2f} s", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m lab_kimia", description="Alat batch Laboratorium Kimia")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    screen = commands.add_parser("screen", help="saring pasangan senyawa: reaksi, bahaya dan APD")
+    screen.add_argument("input", nargs="?", default="-", help="berkas JSONL pasangan senyawa (default: stdin)")
+    screen.add_argument("-o", "--output", default="-", help="berkas JSONL keluaran (default: stdout)")
+    screen.set_defaults(func=cmd_screen)
+
+    audit = commands.add_parser("audit", help="audit inventaris CSV: bahan tidak kompatibel di lokasi yang sama")
+    audit.add_argument("input", help="berkas CSV berkolom compound, location, quantity")
+    audit.add_argument("-o", "--output", default="-", help="berkas CSV laporan pelanggaran (default: stdout)")
+    audit.add_argument("--chunk-rows", type=int, default=50_000, help="jumlah baris per potongan")
+    audit.set_defaults(func=cmd_audit)
+
+    validate = commands.add_parser("validate", help="periksa kesetaraan dan konsistensi semua REACTIONS")
+    validate.set_defaults(func=cmd_validate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
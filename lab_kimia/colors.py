@@ -0,0 +1,87 @@
+# Mesin pencampuran warna untuk visual reaksi
+#
+# Warna hex diubah menjadi array RGB NumPy dan dicampur dalam ruang linear
+# (bukan sRGB mentah) agar campuran tidak tampak terlalu gelap. Matriks warna
+# campuran untuk semua pasangan senyawa dihitung sekali: pasangan yang bereaksi
+# memakai campuran warna produk dari color_change, selain itu campuran kedua
+# senyawa.
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from lab_kimia.balance import ARROW
+
+HEX = re.compile(r"#([0-9A-Fa-f]{6})")
+SHIFTS = np.array([16, 8, 0])
+
+
+def hex_to_rgb(colors):
+    values = []
+    for color in colors:
+        match = HEX.fullmatch(color.strip())
+        if not match:
+            raise ValueError(f"warna hex tidak valid: {color!r}")
+        values.append(int(match.group(1), 16))
+    return (np.array(values, dtype=np.int64).reshape(-1, 1) >> SHIFTS & 255) / 255.0
+
+
+def to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def to_srgb(linear):
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
+
+
+# Fungsi untuk mengurai "#A + #B → #C + #D" menjadi (warna pereaksi, warna produk)
+@lru_cache(maxsize=1024)
+def parse_color_change(text):
+    sides = ARROW.split(text.strip())
+    if len(sides) != 2:
+        raise ValueError(f"color_change harus memiliki tepat satu tanda panah: {text!r}")
+    parsed = []
+    for side in sides:
+        colors = tuple(c.strip().upper() for c in side.split("+"))
+        hex_to_rgb(colors)
+        parsed.append(colors)
+    return parsed[0], parsed[1]
+
+
+def _pad(colors, names, default):
+    return list(colors[:len(names)]) + [default] * (len(names) - len(colors))
+
+
+# Warna pereaksi dan produk satu reaksi; posisi tanpa warna memakai default
+def reaction_colors(reaction, default):
+    reagents, products = parse_color_change(reaction["color_change"][0])
+    return _pad(reagents, reaction["reagents"], default), _pad(products, reaction["products"], default)
+
+
+class ColorMixer:
+    def __init__(self, compounds, reactions, default):
+        self.names = tuple(compounds)
+        self.codes = {name: i for i, name in enumerate(self.names)}
+        base = to_linear(hex_to_rgb([c["color"] for c in compounds.values()])).astype(np.float32)
+
+        # Semua pasangan sekaligus lewat broadcasting: (N, 1, 3) + (1, N, 3)
+        linear = (base[:, None, :] + base[None, :, :]) / 2
+        self.reacted = np.zeros(linear.shape[:2], dtype=bool)
+        for reaction in reactions:
+            i, j = (self.codes.get(name) for name in reaction["reagents"][:2])
+            if i is None or j is None or self.reacted[i, j]:
+                continue
+            _, products = reaction_colors(reaction, default)
+            linear[i, j] = linear[j, i] = np.mean(to_linear(hex_to_rgb(products)), axis=0)
+            self.reacted[i, j] = self.reacted[j, i] = True
+
+        # Disimpan sebagai sRGB 8-bit: 3 byte per pasangan
+        self.rgb = np.rint(to_srgb(linear) * 255).astype(np.uint8)
+
+    # Warna campuran dua senyawa; None jika salah satunya tidak dikenal
+    def mix(self, compound1, compound2):
+        i, j = self.codes.get(compound1), self.codes.get(compound2)
+        if i is None or j is None:
+            return None
+        r, g, b = self.rgb[i, j]
+        return f"#{r:02X}{g:02X}{b:02X}"
@@ -0,0 +1,134 @@
+# Mesin kompatibilitas penyimpanan berbasis bitset
+#
+# Setiap senyawa dipetakan ke satu atau lebih kelompok penyimpanan dari jenis
+# dan bahayanya; kelompok disimpan sebagai bit dalam satu bilangan uint8. Satu
+# rak diperiksa dengan OR-reduce seluruh mask lalu satu tabel pencarian
+# "kelompok apa yang tidak kompatibel dengan gabungan ini", sehingga rak berisi
+# puluhan ribu bahan tetap selesai dalam hitungan milidetik.
+import numpy as np
+
+# Tabel kompatibilitas antarkelompok: ✅ aman, ⚠ hati-hati, ❌ tidak kompatibel
+COMPATIBILITY_DATA = {
+    "Kelompok": ["Asam Anorganik", "Basa", "Pelarut Organik", "Oksidator", "Logam Reaktif", "Gas Bertekanan"],
+    "Asam Anorganik": ["✅", "❌", "⚠", "❌", "❌", "✅"],
+    "Basa": ["❌", "✅", "⚠", "❌", "❌", "✅"],
+    "Pelarut Organik": ["⚠", "⚠", "✅", "❌", "❌", "⚠"],
+    "Oksidator": ["❌", "❌", "❌", "✅", "❌", "❌"],
+    "Logam Reaktif": ["❌", "❌", "❌", "❌", "✅", "✅"],
+    "Gas Bertekanan": ["✅", "✅", "⚠", "❌", "✅", "✅"]
+}
+
+GROUPS = tuple(COMPATIBILITY_DATA["Kelompok"])
+
+# Aturan pengelompokan (jenis, bahaya, kelompok); None berarti jenis/bahaya apa
+# saja. Tabel hanya memiliki satu kelompok asam, jadi semua jenis asam masuk ke sana.
+GROUP_RULES = (
+    ("Asam Kuat", None, "Asam Anorganik"),
+    ("Asam Lemah", None, "Asam Anorganik"),
+    ("Asam", None, "Asam Anorganik"),
+    ("Asam Organik", None, "Asam Anorganik"),
+    ("Basa Kuat", None, "Basa"),
+    ("Basa Lemah", None, "Basa"),
+    ("Alkohol", None, "Pelarut Organik"),
+    ("Hidrokarbon", None, "Pelarut Organik"),
+    ("Oksidator", None, "Oksidator"),
+    (None, "Pengoksidasi", "Oksidator"),
+    ("Logam", "Mudah Terbakar", "Logam Reaktif"),
+    (None, "Reaktif", "Logam Reaktif"),
+    ("Gas", None, "Gas Bertekanan"),
+    (None, "Gas", "Gas Bertekanan"),
+    (None, "Gas Bertekanan", "Gas Bertekanan"),
+)
+
+# Tingkat pelanggaran, dari yang paling berat
+LEVELS = ("❌", "⚠")
+
+
+# Fungsi untuk menghitung mask kelompok satu senyawa dari jenis dan bahayanya
+def group_mask(compound):
+    mask = 0
+    for kind, hazard, group in GROUP_RULES:
+        if (kind is None or compound["type"] == kind) and (hazard is None or hazard in compound["hazards"]):
+            mask |= 1 << GROUPS.index(group)
+    return mask
+
+
+def mask_groups(mask):
+    return [g for i, g in enumerate(GROUPS) if mask >> i & 1]
+
+
+class CompatibilityEngine:
+    def __init__(self, compounds):
+        self.names = tuple(compounds)
+        self.codes = {name: i for i, name in enumerate(self.names)}
+        # Satu mask tambahan bernilai 0 di akhir untuk kode -1 (senyawa tidak dikenal)
+        self.masks = np.array([group_mask(c) for c in compounds.values()] + [0], dtype=np.uint8)
+
+        # Per tingkat: bit kelompok yang berkonflik dengan kelompok i
+        self.conflicts = {}
+        for level in LEVELS:
+            bits = np.zeros(len(GROUPS), dtype=np.uint8)
+            for i, g in enumerate(GROUPS):
+                for j, symbol in enumerate(COMPATIBILITY_DATA[g]):
+                    if symbol == level:
+                        bits[i] |= 1 << j
+            self.conflicts[level] = bits
+
+        # Tabel untuk semua 2^kelompok gabungan: mask -> OR konflik setiap bitnya
+        every = np.arange(1 << len(GROUPS), dtype=np.uint8)
+        self.conflicts_of = np.zeros(len(every), dtype=np.uint8)
+        for level in LEVELS:
+            for i in range(len(GROUPS)):
+                self.conflicts_of[(every >> i & 1).astype(bool)] |= self.conflicts[level][i]
+
+    # Nama senyawa -> kode (-1 untuk yang tidak dikenal)
+    def encode(self, names):
+        return np.fromiter((self.codes.get(n, -1) for n in names), dtype=np.intp, count=len(names))
+
+    def groups_of(self, name):
+        return mask_groups(int(self.masks[self.codes.get(name, -1)]))
+
+    # Status dua senyawa berbeda: tingkat terberat di antara pasangan kelompoknya
+    def check_pair(self, compound1, compound2):
+        if compound1 == compound2:
+            return "✅"
+        m1, m2 = (int(self.masks[self.codes.get(c, -1)]) for c in (compound1, compound2))
+        for level in LEVELS:
+            if any(self.conflicts[level][i] & m2 for i in range(len(GROUPS)) if m1 >> i & 1):
+                return level
+        return "✅"
+
+    # Fungsi untuk memeriksa satu rak. Jalur cepat murni bitwise: bila gabungan
+    # mask tidak mengenai tabel konflik, rak aman. Selain itu setiap pasangan
+    # kelompok yang berkonflik dilaporkan dengan contoh senyawanya; kelompok yang
+    # hanya dimiliki bersama oleh satu senyawa (mis. HNO₃: asam + oksidator)
+    # tidak dianggap konflik dengan dirinya sendiri.
+    def check_shelf(self, codes):
+        codes = np.unique(np.asarray(codes, dtype=np.intp))
+        codes = codes[codes >= 0]
+        masks = self.masks[codes]
+        union = int(np.bitwise_or.reduce(masks, initial=0))
+        if not self.conflicts_of[union] & union:
+            return []
+
+        bits = (masks[:, None] >> np.arange(len(GROUPS), dtype=np.uint8) & 1).astype(bool)
+        counts = bits.sum(axis=0)
+        violations = []
+        for level in LEVELS:
+            for i in range(len(GROUPS)):
+                for j in range(i + 1, len(GROUPS)):
+                    if not (self.conflicts[level][i] >> j & 1) or not counts[i] or not counts[j]:
+                        continue
+                    holders_i, holders_j = codes[bits[:, i]], codes[bits[:, j]]
+                    if len(holders_i) == len(holders_j) == 1 and holders_i[0] == holders_j[0]:
+                        continue
+                    first = holders_i[0]
+                    second = holders_j[holders_j != first][0] if np.any(holders_j != first) else holders_j[0]
+                    if first == second:
+                        first = holders_i[holders_i != second][0]
+                    violations.append({
+                        "level": level,
+                        "groups": (GROUPS[i], GROUPS[j]),
+                        "compounds": (self.names[first], self.names[second]),
+                    })
+        return violations
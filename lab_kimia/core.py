@@ -0,0 +1,232 @@
+# Inti logika kimia tanpa Streamlit: dataset, pencarian reaksi, warna dan filter unsur
+#
+# Semua cache di sini berlaku per proses, sehingga dipakai bersama oleh semua
+# sesi Streamlit maupun oleh CLI batch.
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from lab_kimia.colors import ColorMixer, reaction_colors
+from lab_kimia.compatibility import CompatibilityEngine
+from lab_kimia.data import DATA_DIR, load_datasets
+from lab_kimia.diskcache import DiskLRUCache
+from lab_kimia.elements import ElementStore
+from lab_kimia.formula import molar_masses
+from lab_kimia.graph import ReactionGraph
+from lab_kimia.kinetics import half_lives, reaction_species, simulate, sweep_values
+from lab_kimia.reactions import build_reaction_index, find_reaction
+from lab_kimia.search import SearchIndex, build_entries
+from lab_kimia.thermo import Thermochemistry
+from lab_kimia.titration import ACID_BASE, titration_curve
+
+# Warna default untuk produk yang tidak terdaftar di COMPOUNDS
+DEFAULT_COLOR = "#DDDDDD"
+
+# Cache animasi reaksi di disk, dipakai bersama oleh semua sesi dan proses.
+# LAB_KIMIA_ANIMATION_DIR memindahkannya, mis. bila folder repo hanya-baca.
+ANIMATION_DIR = os.environ.get("LAB_KIMIA_ANIMATION_DIR",
+                               os.path.join(os.path.dirname(DATA_DIR), ".cache", "animations"))
+MAX_ANIMATION_BYTES = 32 * 2**20
+
+
+@lru_cache(maxsize=None)
+def get_datasets():
+    return load_datasets()
+
+
+@lru_cache(maxsize=None)
+def get_element_store():
+    return ElementStore(get_datasets()[0])
+
+
+@lru_cache(maxsize=None)
+def get_reaction_index():
+    return build_reaction_index(get_datasets()[2])
+
+
+@lru_cache(maxsize=None)
+def get_reaction_graph():
+    return ReactionGraph(get_datasets()[2])
+
+
+@lru_cache(maxsize=None)
+def get_compatibility_engine():
+    return CompatibilityEngine(get_datasets()[1])
+
+
+# Nama dan rumus senyawa yang dikenali audit inventaris (pandas baru dimuat di sini)
+@lru_cache(maxsize=None)
+def get_inventory_aliases():
+    from lab_kimia.inventory import compound_aliases
+
+    return compound_aliases(get_datasets()[1])
+
+
+@lru_cache(maxsize=None)
+def get_search_index():
+    return SearchIndex(build_entries(*get_datasets()))
+
+
+def search(query, limit=10):
+    return get_search_index().search(query, limit)
+
+
+def match_reaction(compound1, compound2):
+    return find_reaction(get_reaction_index(), compound1, compound2)
+
+
+def compound_color(name):
+    compound = get_datasets()[1].get(name)
+    return compound["color"] if compound else DEFAULT_COLOR
+
+
+# Matriks warna campuran semua pasangan senyawa, dihitung sekali per proses
+@lru_cache(maxsize=None)
+def get_color_mixer():
+    _, compounds, reactions = get_datasets()
+    return ColorMixer(compounds, reactions, DEFAULT_COLOR)
+
+
+def mix_color(compound1, compound2):
+    return get_color_mixer().mix(compound1, compound2) or DEFAULT_COLOR
+
+
+# Warna (pereaksi, produk) sesuai color_change reaksi
+def get_reaction_colors(reaction):
+    return reaction_colors(reaction, DEFAULT_COLOR)
+
+
+@lru_cache(maxsize=None)
+def get_animation_cache():
+    return DiskLRUCache(ANIMATION_DIR, MAX_ANIMATION_BYTES, suffix=".gif")
+
+
+# Animasi GIF reaksi: dirender sekali, selanjutnya dibaca dari cache disk. Cache
+# hanya pelengkap: bila foldernya tidak bisa dibaca atau ditulis, animasi tetap
+# dirender dan dikembalikan tanpa disimpan.
+def reaction_animation(reaction):
+    # PIL baru dimuat saat animasi pertama dibutuhkan
+    from lab_kimia.animation import RENDER_VERSION, SIZE, render_beaker_gif
+
+    reagent_colors, product_colors = get_reaction_colors(reaction)
+    key = (RENDER_VERSION, SIZE, reaction["equation"], tuple(reagent_colors), tuple(product_colors))
+    cache = get_animation_cache()
+    try:
+        data = cache.get(key)
+    except OSError:
+        data = None
+    if data is None:
+        data = render_beaker_gif(reagent_colors, product_colors)
+        try:
+            cache.put(key, data)
+        except OSError:
+            pass
+    return data
+
+
+# Massa molar semua senyawa dihitung dalam satu lintasan tervektorisasi
+@lru_cache(maxsize=None)
+def get_molar_masses():
+    compounds = get_datasets()[1]
+    masses = molar_masses([c["formula"] for c in compounds.values()], get_datasets()[0])
+    return dict(zip(compounds, masses.tolist()))
+
+
+def compound_molar_mass(name):
+    return get_molar_masses().get(name, float("nan"))
+
+
+# ΔH semua reaksi dihitung sekali per proses dalam satu perkalian matriks
+@lru_cache(maxsize=None)
+def get_thermochemistry():
+    return Thermochemistry(get_datasets()[2])
+
+
+def reaction_enthalpy(reaction):
+    return get_thermochemistry().enthalpy_of(reaction["equation"])
+
+
+def get_element(key):
+    return get_element_store().get(key)
+
+
+# Simulasi kinetika satu reaksi: anggota batch pertama memakai parameter dasar,
+# sisanya menyapu parameter ("k" atau "a0") pada rentang yang diberikan.
+# Hasil di-cache per reaksi dan set parameter.
+@lru_cache(maxsize=32)
+def reaction_kinetics(reaction_index, k, a0, b0, t_end, sweep=None):
+    names, nu = reaction_species(get_datasets()[2][reaction_index]["equation"])
+    ks, a0s = np.array([k]), np.array([a0])
+    values = np.empty(0)
+    if sweep is not None:
+        parameter, start, stop, count = sweep
+        values = sweep_values(start, stop, count, log=parameter == "k")
+        if parameter == "k":
+            ks = np.concatenate([ks, values])
+        else:
+            a0s = np.concatenate([a0s, values])
+    times, concentrations = simulate(nu, ks, a0s, b0, t_end)
+    return {
+        "species": names,
+        "times": times,
+        "base": concentrations[:, 0, :],
+        "sweep_values": values,
+        "sweep_half_lives": half_lives(times, concentrations[:, 1:, :]),
+    }
+
+
+# Asam dan basa di COMPOUNDS yang memiliki data titrasi: (asam, basa)
+@lru_cache(maxsize=None)
+def get_titration_compounds():
+    compounds = get_datasets()[1]
+    titratable = [name for name, c in compounds.items() if c["formula"] in ACID_BASE]
+    acids = tuple(name for name in titratable if compounds[name]["type"].startswith("Asam"))
+    bases = tuple(name for name in titratable if compounds[name]["type"].startswith("Basa"))
+    return acids, bases
+
+
+# Kurva titrasi analit (di labu) dengan titran, di-cache per pasangan dan konsentrasi
+@lru_cache(maxsize=128)
+def titration(analyte, titrant, c_analyte, c_titrant):
+    compounds = get_datasets()[1]
+    return titration_curve(compounds[analyte]["formula"], compounds[titrant]["formula"], c_analyte, c_titrant)
+
+
+@lru_cache(maxsize=64)
+def filter_elements(category):
+    store = get_element_store()
+    if category == "Semua":
+        return store.elements
+    return store.select(np.flatnonzero(store.mask(category=category)))
+
+
+# Fungsi untuk menyaring satu pasangan senyawa: reaksi, bahaya dan APD.
+# Tanpa reaksi yang diketahui, bahaya adalah gabungan bahaya kedua senyawa.
+def screen_pair(compound1, compound2):
+    compounds = get_datasets()[1]
+    reaction = match_reaction(compound1, compound2)
+    result = {
+        "compound1": compound1,
+        "compound2": compound2,
+        "unknown": [c for c in dict.fromkeys((compound1, compound2)) if c not in compounds],
+    }
+    if reaction:
+        enthalpy = reaction_enthalpy(reaction)
+        result["reaction"] = {
+            "type": reaction["type"],
+            "equation": reaction["equation"],
+            "products": reaction["products"],
+            "energy": reaction["energy"],
+            "enthalpy": None if np.isnan(enthalpy) else round(enthalpy, 1),
+        }
+        result["hazards"] = reaction["hazards"]
+        result["apd"] = reaction["apd"]
+    else:
+        hazards = []
+        for c in (compound1, compound2):
+            hazards += compounds[c]["hazards"] if c in compounds else []
+        result["reaction"] = None
+        result["hazards"] = list(dict.fromkeys(hazards))
+        result["apd"] = []
+    return result
@@ -0,0 +1,103 @@
+# Dataset kimia dalam format Arrow IPC (Feather v2)
+#
+# load_datasets() mengubah tabel menjadi list/dict Python, sehingga data tetap
+# disalin saat dimuat. Keuntungannya ada di cache: pemanggil (get_datasets,
+# st.cache_resource) memuatnya sekali per proses, bukan setiap rerun.
+#
+# Sumber yang diedit manusia ada di data/source/*.json. Setelah mengubahnya,
+# bangun ulang berkas biner dengan:
+#
+#     python -m lab_kimia.data
+import json
+import os
+
+import pyarrow as pa
+
+# Naikkan jika skema berubah agar berkas lama ditolak dan dibangun ulang
+FORMAT_VERSION = "1"
+VERSION_KEY = b"lab_kimia.format_version"
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+SOURCE_DIR = os.path.join(DATA_DIR, "source")
+
+_strings = pa.list_(pa.string())
+
+SCHEMAS = {
+    "periodic_table": pa.schema([
+        ("Symbol", pa.string()),
+        ("Name", pa.string()),
+        ("AtomicNumber", pa.int16()),
+        ("AtomicMass", pa.float64()),
+        ("Group", pa.int8()),
+        ("Period", pa.int8()),
+        ("Category", pa.string()),
+        ("Color", pa.string()),
+        ("Electronegativity", pa.float64()),
+        ("Hazards", _strings),
+    ]),
+    "compounds": pa.schema([
+        ("name", pa.string()),
+        ("color", pa.string()),
+        ("formula", pa.string()),
+        ("type", pa.string()),
+        ("hazards", _strings),
+    ]),
+    "reactions": pa.schema([
+        ("reagents", _strings),
+        ("products", _strings),
+        ("equation", pa.string()),
+        ("type", pa.string()),
+        ("color_change", _strings),
+        ("energy", pa.string()),
+        ("hazards", _strings),
+        ("apd", _strings),
+        ("description", pa.string()),
+    ]),
+}
+
+
+def arrow_path(name):
+    return os.path.join(DATA_DIR, f"{name}.arrow")
+
+
+# Fungsi untuk membaca satu tabel beserta pemeriksaan versi formatnya
+def load_table(name):
+    with pa.memory_map(arrow_path(name), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    version = (table.schema.metadata or {}).get(VERSION_KEY, b"").decode()
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"{arrow_path(name)} berformat versi {version or '?'}, diharapkan {FORMAT_VERSION}; "
+            "jalankan 'python -m lab_kimia.data' untuk membangun ulang"
+        )
+    return table
+
+
+# Fungsi untuk memuat PERIODIC_TABLE, COMPOUNDS dan REACTIONS dalam bentuk Python
+def load_datasets():
+    periodic_table = load_table("periodic_table").to_pylist()
+    compounds = {row.pop("name"): row for row in load_table("compounds").to_pylist()}
+    reactions = load_table("reactions").to_pylist()
+    return periodic_table, compounds, reactions
+
+
+# Fungsi untuk mengompilasi sumber JSON menjadi berkas Arrow
+def build_table(name):
+    with open(os.path.join(SOURCE_DIR, f"{name}.json"), encoding="utf-8") as f:
+        rows = json.load(f)
+    schema = SCHEMAS[name].with_metadata({VERSION_KEY: FORMAT_VERSION.encode()})
+    table = pa.Table.from_pylist(rows, schema=schema)
+    with pa.OSFile(arrow_path(name), "wb") as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            writer.write_table(table)
+    return table
+
+
+def main():
+    for name in SCHEMAS:
+        table = build_table(name)
+        print(f"{arrow_path(name)}: {table.num_rows} baris, {os.path.getsize(arrow_path(name))} byte")
+
+
+if __name__ == "__main__":
+    main()
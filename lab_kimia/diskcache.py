@@ -0,0 +1,79 @@
+# Cache berkas di disk dengan batas ukuran dan pengusiran LRU
+#
+# Setiap entri adalah satu berkas bernama hash kuncinya. Waktu modifikasi
+# berkas dipakai sebagai waktu akses terakhir: get() memperbaruinya, dan put()
+# menghapus berkas tertua sampai total ukuran kembali di bawah batas. Penulisan
+# bersifat atomik (berkas sementara + os.replace) sehingga aman dipakai banyak
+# sesi dan proses sekaligus.
+import hashlib
+import os
+import tempfile
+
+
+class DiskLRUCache:
+    def __init__(self, directory, max_bytes, suffix=""):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+    def path(self, key):
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.suffix)
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key, data):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.evict()
+
+    def entries(self):
+        result = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(self.suffix) or entry.name.endswith(".tmp"):
+                        continue
+                    # Proses lain bisa menghapus berkas di antara scandir dan stat();
+                    # lewati berkas itu saja, bukan seluruh pemindaian
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            result.append((stat.st_mtime, stat.st_size, entry.path))
+                    except FileNotFoundError:
+                        pass
+        except FileNotFoundError:
+            return []
+        return result
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    # Hapus entri yang paling lama tidak diakses sampai total <= max_bytes
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,134 @@
+# Penyimpanan unsur berorientasi kolom dengan NumPy structured array
+#
+# Setiap unsur adalah satu baris berukuran tetap (beberapa byte per kolom),
+# dengan pencarian O(1) berdasarkan nomor atom atau simbol, serta filter dan
+# pengurutan tervektorisasi.
+import numpy as np
+
+ELEMENT_DTYPE = np.dtype([
+    ("atomic_number", np.int32),
+    ("mass", np.float64),
+    ("electronegativity", np.float32),  # NaN jika tidak diketahui
+    ("group", np.int8),  # 0 untuk lantanida/aktinida tanpa golongan
+    ("period", np.int8),
+    ("category", np.int8),
+])
+
+# Kolom PERIODIC_TABLE yang menentukan posisi, bukan sifat yang bisa dipetakan
+POSITION_FIELDS = ("AtomicNumber", "Group", "Period")
+
+
+# Posisi unsur di grid tabel periodik (kolom = golongan, baris = periode), berbasis 1
+def grid_position(element):
+    if element["Group"] is not None:
+        return element["Group"], element["Period"]
+    # Lantanida/aktinida tanpa golongan ditaruh di baris blok-f di bawah tabel utama
+    first = 57 if element["Period"] == 6 else 89
+    return 3 + element["AtomicNumber"] - first, element["Period"] + 3
+
+
+class ElementStore:
+    def __init__(self, periodic_table):
+        self.elements = tuple(periodic_table)
+        self.categories = tuple(dict.fromkeys(e["Category"] for e in self.elements))
+        category_codes = {name: code for code, name in enumerate(self.categories)}
+
+        self.records = np.array([
+            (
+                e["AtomicNumber"],
+                e["AtomicMass"],
+                np.nan if e["Electronegativity"] is None else e["Electronegativity"],
+                e["Group"] or 0,
+                e["Period"],
+                category_codes[e["Category"]],
+            )
+            for e in self.elements
+        ], dtype=ELEMENT_DTYPE)
+
+        # Tabel langsung nomor atom -> baris; -1 untuk nomor yang tidak ada
+        self._row_by_number = np.full(int(self.records["atomic_number"].max(initial=0)) + 1, -1, dtype=np.intp)
+        self._row_by_number[self.records["atomic_number"]] = np.arange(len(self.records))
+        self._row_by_symbol = {e["Symbol"]: i for i, e in enumerate(self.elements)}
+
+        # Grid golongan x periode: sel kosong berisi -1 (kode kategori) atau "" (teks)
+        columns, rows = np.array([grid_position(e) for e in self.elements], dtype=np.intp).reshape(-1, 2).T - 1
+        self._grid_cells = (rows, columns)
+        self.grid_shape = (int(rows.max(initial=0)) + 1, 18)
+        self.category_grid = np.full(self.grid_shape, -1, dtype=np.int8)
+        self.category_grid[self._grid_cells] = self.records["category"]
+        self.symbol_grid = self._text_grid("Symbol")
+        self.name_grid = self._text_grid("Name")
+        # Sifat numerik yang bisa dijadikan heatmap, termasuk kolom yang ditambahkan kemudian
+        self.trend_fields = tuple(
+            key for key in (self.elements[0] if self.elements else {})
+            if key not in POSITION_FIELDS
+            and all(isinstance(e[key], (int, float)) and not isinstance(e[key], bool) or e[key] is None
+                    for e in self.elements)
+        )
+        self._trend_grids = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def nbytes(self):
+        return self.records.nbytes + self._row_by_number.nbytes
+
+    # Baris untuk nomor atom (int) atau simbol (str); KeyError jika tidak ada
+    def row(self, key):
+        if isinstance(key, str):
+            return self._row_by_symbol[key]
+        if 0 <= key < len(self._row_by_number) and self._row_by_number[key] >= 0:
+            return int(self._row_by_number[key])
+        raise KeyError(key)
+
+    def get(self, key):
+        return self.elements[self.row(key)]
+
+    def category_code(self, category):
+        return self.categories.index(category) if category in self.categories else -1
+
+    # Mask boolean untuk kombinasi kondisi; None berarti tidak disaring
+    def mask(self, category=None, group=None, period=None, min_electronegativity=None):
+        result = np.ones(len(self.records), dtype=bool)
+        if category is not None:
+            result &= self.records["category"] == self.category_code(category)
+        if group is not None:
+            result &= self.records["group"] == group
+        if period is not None:
+            result &= self.records["period"] == period
+        if min_electronegativity is not None:
+            result &= self.records["electronegativity"] >= min_electronegativity
+        return result
+
+    # Indeks baris terurut menurut satu kolom, opsional hanya baris yang lolos mask
+    def sort_by(self, field, mask=None, descending=False):
+        rows = np.arange(len(self.records)) if mask is None else np.flatnonzero(mask)
+        values = self.records[field][rows]
+        # Negasi (bukan membalik urutan) agar NaN tetap di akhir
+        order = np.argsort(-values if descending else values, kind="stable")
+        return rows[order]
+
+    def select(self, rows):
+        return tuple(self.elements[i] for i in rows)
+
+    def _text_grid(self, key):
+        grid = np.full(self.grid_shape, "", dtype=object)
+        grid[self._grid_cells] = [e[key] for e in self.elements]
+        return grid
+
+    # Satu sifat dalam posisi tabel periodik sebagai array 2-D (NaN untuk sel
+    # kosong dan nilai yang tidak diketahui), dihitung sekali per sifat. Jika
+    # category diberikan, hasilnya salinan dengan sel di luar kategori di-NaN-kan.
+    def trend_grid(self, key, category=None):
+        grid = self._trend_grids.get(key)
+        if grid is None:
+            if key not in self.trend_fields:
+                raise KeyError(key)
+            grid = np.full(self.grid_shape, np.nan)
+            grid[self._grid_cells] = [np.nan if e[key] is None else e[key] for e in self.elements]
+            grid.flags.writeable = False
+            self._trend_grids[key] = grid
+        if category is None:
+            return grid
+        return np.where(self.category_grid == self.category_code(category), grid, np.nan)
@@ -0,0 +1,101 @@
+# Parser rumus kimia (subskrip Unicode, kurung, hidrat) dan massa molar tervektorisasi
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+# Pemisah hidrat, misalnya CuSO₄·5H₂O
+HYDRATE_SEPARATORS = re.compile(r"[·•∙*.]")
+
+TOKEN = re.compile(r"([A-Z][a-z]?)|(\d+)|([(\[])|([)\]])|(\s+)")
+COUNT = re.compile(r"\d+")
+COEFFICIENT = re.compile(r"\s*(\d*)(.*)")
+
+
+# Mengubah subskrip Unicode menjadi angka ASCII: H₂SO₄ -> H2SO4
+def to_ascii(formula):
+    return formula.translate(SUBSCRIPTS)
+
+
+def _parse_group(text):
+    stack = [{}]
+    pos = 0
+    while pos < len(text):
+        match = TOKEN.match(text, pos)
+        if not match:
+            raise ValueError(f"karakter tidak dikenal {text[pos]!r} dalam rumus {text!r}")
+        symbol, number, opening, closing, space = match.groups()
+        pos = match.end()
+        if space:
+            continue
+        if opening:
+            stack.append({})
+            continue
+
+        # Angka setelah unsur atau kurung tutup adalah jumlahnya
+        count_match = COUNT.match(text, pos)
+        count = int(count_match.group()) if count_match else 1
+        if count_match:
+            pos = count_match.end()
+
+        if symbol:
+            stack[-1][symbol] = stack[-1].get(symbol, 0) + count
+        elif closing:
+            if len(stack) == 1:
+                raise ValueError(f"kurung tutup tanpa pasangan dalam rumus {text!r}")
+            group = stack.pop()
+            for element, n in group.items():
+                stack[-1][element] = stack[-1].get(element, 0) + n * count
+        else:
+            raise ValueError(f"angka {number} tanpa unsur dalam rumus {text!r}")
+    if len(stack) != 1:
+        raise ValueError(f"kurung tidak tertutup dalam rumus {text!r}")
+    return stack[0]
+
+
+# Fungsi untuk mengurai rumus menjadi jumlah atom per unsur (hasil di-memoize)
+@lru_cache(maxsize=65536)
+def parse_formula(formula):
+    counts = {}
+    for part in HYDRATE_SEPARATORS.split(to_ascii(formula).strip()):
+        # Koefisien di depan bagian hidrat: 5H2O
+        coefficient = COEFFICIENT.match(part)
+        multiplier = int(coefficient.group(1) or 1)
+        body = coefficient.group(2)
+        if not body:
+            raise ValueError(f"bagian kosong dalam rumus {formula!r}")
+        for element, n in _parse_group(body).items():
+            counts[element] = counts.get(element, 0) + n * multiplier
+    return MappingProxyType(counts)
+
+
+# Fungsi untuk menghitung massa molar banyak rumus dalam satu perkalian matriks.
+# Rumus yang sama hanya diproses sekali; rumus dengan unsur yang tidak ada di
+# tabel periodik bernilai NaN.
+def molar_masses(formulas, periodic_table):
+    columns = {e["Symbol"]: i for i, e in enumerate(periodic_table)}
+    masses = np.array([e["AtomicMass"] for e in periodic_table], dtype=np.float64)
+
+    unique = {}
+    inverse = np.fromiter((unique.setdefault(f, len(unique)) for f in formulas), dtype=np.intp, count=len(formulas))
+
+    rows, cols, counts = [], [], []
+    missing = np.zeros(len(unique), dtype=bool)
+    for row, formula in enumerate(unique):
+        for element, n in parse_formula(formula).items():
+            col = columns.get(element)
+            if col is None:
+                missing[row] = True
+                continue
+            rows.append(row)
+            cols.append(col)
+            counts.append(n)
+
+    matrix = np.zeros((len(unique), len(periodic_table)), dtype=np.float64)
+    np.add.at(matrix, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), counts)
+    result = matrix @ masses
+    result[missing] = np.nan
+    return result[inverse]
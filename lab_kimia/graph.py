@@ -0,0 +1,77 @@
+# Graf reaksi: senyawa <-> reaksi dengan daftar tetangga yang dihitung sekali
+#
+# Selain pencarian "dua pereaksi -> reaksi", graf ini menjawab kueri terbalik:
+# reaksi mana yang menghasilkan suatu produk, dengan apa suatu senyawa bereaksi,
+# dan rute bertahap terpendek dari bahan awal menuju target.
+from collections import deque
+
+
+class ReactionGraph:
+    def __init__(self, reactions):
+        self.reactions = tuple(reactions)
+        producers, consumers, partners = {}, {}, {}
+        for rid, reaction in enumerate(self.reactions):
+            reagents = tuple(dict.fromkeys(reaction["reagents"]))
+            for product in dict.fromkeys(reaction["products"]):
+                producers.setdefault(product, []).append(rid)
+            for reagent in reagents:
+                consumers.setdefault(reagent, []).append(rid)
+                for other in reagents:
+                    if other != reagent:
+                        partners.setdefault(reagent, []).append((other, rid))
+        self.producers = {k: tuple(v) for k, v in producers.items()}
+        self.consumers = {k: tuple(v) for k, v in consumers.items()}
+        self.partners = {k: tuple(v) for k, v in partners.items()}
+        self._reagents = tuple(frozenset(r["reagents"]) for r in self.reactions)
+        self.compounds = tuple(sorted(set(self.producers) | set(self.consumers)))
+
+    # Indeks reaksi yang menghasilkan produk tersebut
+    def producing(self, product):
+        return self.producers.get(product, ())
+
+    # Pasangan (senyawa lain, indeks reaksi) yang bereaksi dengan senyawa tersebut
+    def partners_of(self, compound):
+        return self.partners.get(compound, ())
+
+    # Rute terpendek (dalam jumlah tahap) dari bahan awal ke target, dibatasi
+    # max_steps. BFS per tahap: reaksi berjalan ketika semua pereaksinya sudah
+    # tersedia, dan produk barunya menjadi frontier tahap berikutnya.
+    # Mengembalikan daftar indeks reaksi sesuai urutan pelaksanaan, [] jika
+    # target sudah termasuk bahan awal, atau None jika tidak terjangkau.
+    def route(self, start, target, max_steps=4):
+        available = set(start)
+        if target in available:
+            return []
+        missing = [len(r) for r in self._reagents]
+        via, step_of = {}, {}
+        frontier = deque(available)
+        for step in range(1, max_steps + 1):
+            fired = []
+            while frontier:
+                for rid in self.consumers.get(frontier.popleft(), ()):
+                    missing[rid] -= 1
+                    if missing[rid] == 0:
+                        fired.append(rid)
+            for rid in fired:
+                step_of[rid] = step
+                for product in self.reactions[rid]["products"]:
+                    if product not in available:
+                        available.add(product)
+                        via[product] = rid
+                        frontier.append(product)
+            if target in available:
+                return self._trace(target, via, step_of)
+            if not frontier:
+                break
+        return None
+
+    # Telusuri balik hanya reaksi yang benar-benar dibutuhkan untuk target
+    def _trace(self, target, via, step_of):
+        needed, stack = set(), [target]
+        while stack:
+            rid = via.get(stack.pop())
+            if rid is None or rid in needed:
+                continue
+            needed.add(rid)
+            stack.extend(self._reagents[rid])
+        return sorted(needed, key=lambda rid: (step_of[rid], rid))
@@ -0,0 +1,153 @@
+# Audit penyimpanan inventaris laboratorium secara streaming
+#
+# CSV berkolom compound, location, quantity dibaca per potongan. Setiap potongan
+# langsung diringkas menjadi jumlah per (lokasi, senyawa), sehingga memori
+# bergantung pada jumlah pasangan unik, bukan jumlah baris. Setelah berkas habis,
+# setiap lokasi diperiksa sebagai satu rak oleh CompatibilityEngine.
+#
+# Senyawa dikenali dari nama tampilan aplikasi ("Asam Klorida (HCl)"), nama saja
+# ("Asam Klorida", tanpa memperhatikan huruf besar) atau rumusnya ("HCl", "H2SO4",
+# "H₂SO₄"). Baris tanpa lokasi tidak disimpan bersama apa pun, sehingga hanya
+# dihitung dan tidak ikut diperiksa sebagai rak.
+import csv
+import io
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from lab_kimia.formula import to_ascii
+
+COLUMNS = ("compound", "location", "quantity")
+CHUNK_ROWS = 50_000
+
+# Jumlah nama senyawa tidak dikenal yang disimpan sebagai contoh
+MAX_UNKNOWN = 100
+
+REPORT_FIELDS = ["location", "level", "group1", "group2", "compound1", "quantity1", "compound2", "quantity2"]
+
+
+# Nama tampilan diakhiri rumus dalam kurung: "Asam Klorida (HCl)" -> "Asam Klorida"
+DISPLAY_FORMULA = re.compile(r"\s*\([^()]*\)$")
+
+
+# Alias -> nama senyawa di COMPOUNDS. Nama disimpan apa adanya dan dalam bentuk
+# casefold (untuk pencocokan tanpa memperhatikan huruf besar); rumus hanya apa
+# adanya karena CO dan Co berbeda. Alias yang menunjuk ke lebih dari satu senyawa
+# dibuang.
+def compound_aliases(compounds):
+    aliases = {}
+    ambiguous = set()
+    for name, compound in compounds.items():
+        formula = compound["formula"]
+        bare = DISPLAY_FORMULA.sub("", name)
+        for alias in {name, bare, name.casefold(), bare.casefold(), formula, to_ascii(formula)}:
+            if aliases.setdefault(alias, name) != name:
+                ambiguous.add(alias)
+    for alias in ambiguous:
+        del aliases[alias]
+    return aliases
+
+
+def _size(source):
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END)
+    source.seek(position)
+    return size
+
+
+# Fungsi untuk memeriksa header CSV sebelum dibaca per potongan
+def _check_header(source):
+    position = source.tell()
+    try:
+        header = pd.read_csv(source, nrows=0, skipinitialspace=True).columns
+    except pd.errors.EmptyDataError as exc:
+        raise ValueError(f"CSV kosong; harus memiliki kolom {', '.join(COLUMNS)}") from exc
+    source.seek(position)
+    missing = [c for c in COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f"CSV harus memiliki kolom {', '.join(COLUMNS)} (tidak ada: {', '.join(missing)})")
+
+
+# Fungsi untuk mengaudit inventaris dari path atau objek berkas biner. aliases
+# (dari compound_aliases) memetakan nama atau rumus ke nama senyawa; tanpa itu
+# hanya nama tampilan yang dikenali. progress(fraksi, baris) dipanggil setelah
+# setiap potongan.
+def audit_inventory(source, engine, chunk_rows=CHUNK_ROWS, progress=None, aliases=None):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return audit_inventory(f, engine, chunk_rows, progress, aliases)
+
+    _check_header(source)
+    lookup = {alias: engine.codes[name] for alias, name in (aliases or {}).items() if name in engine.codes}
+    lookup.update(engine.codes)
+    total_bytes = _size(source) or 1
+    quantities = {}
+    unknown = {}
+    rows = unknown_rows = unlocated_rows = 0
+    reader = pd.read_csv(source, chunksize=chunk_rows, usecols=list(COLUMNS), dtype=str,
+                         skipinitialspace=True, keep_default_na=False)
+    for chunk in reader:
+        names = chunk["compound"].str.strip()
+        # Cocok persis dulu; hanya sisanya dicoba lagi tanpa memperhatikan huruf besar
+        codes = names.map(lookup)
+        retry = codes.isna()
+        if retry.any():
+            codes[retry] = names[retry].str.casefold().map(lookup)
+        codes = codes.fillna(-1).to_numpy(dtype=np.intp)
+        missing = codes < 0
+        if missing.any():
+            unknown_rows += int(missing.sum())
+            for name, count in names[missing].value_counts().items():
+                if name in unknown or len(unknown) < MAX_UNKNOWN:
+                    unknown[name] = unknown.get(name, 0) + int(count)
+
+        locations = chunk["location"].str.strip()
+        located = (locations != "").to_numpy()
+        unlocated_rows += int((~located).sum())
+        amounts = pd.to_numeric(chunk["quantity"], errors="coerce").fillna(0.0)
+        summary = pd.DataFrame({"location": locations, "code": codes, "quantity": amounts})[located]
+        for key, amount in summary.groupby(["location", "code"], sort=False)["quantity"].sum().items():
+            quantities[key] = quantities.get(key, 0.0) + amount
+
+        rows += len(chunk)
+        if progress:
+            progress(min(source.tell() / total_bytes, 1.0), rows)
+
+    by_location = {}
+    for location, code in quantities:
+        by_location.setdefault(location, []).append(code)
+
+    violations = []
+    for location in sorted(by_location):
+        for v in engine.check_shelf(by_location[location]):
+            first, second = (engine.codes[c] for c in v["compounds"])
+            violations.append({
+                "location": location,
+                "level": v["level"],
+                "group1": v["groups"][0],
+                "group2": v["groups"][1],
+                "compound1": v["compounds"][0],
+                "quantity1": quantities[location, first],
+                "compound2": v["compounds"][1],
+                "quantity2": quantities[location, second],
+            })
+
+    return {
+        "rows": rows,
+        "locations": len(by_location),
+        "unknown_rows": unknown_rows,
+        "unknown": unknown,
+        "unlocated_rows": unlocated_rows,
+        "violations": violations,
+    }
+
+
+# Laporan pelanggaran dalam CSV (bytes) untuk diunduh atau ditulis ke berkas
+def report_csv(report):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_FIELDS)
+    writer.writeheader()
+    writer.writerows(report["violations"])
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,20 @@
+# Indeks reaksi berbasis hash: pasangan pereaksi -> reaksi
+
+
+# Kunci indeks tidak bergantung urutan: {A, B} == {B, A}
+def reagent_key(*reagents):
+    return frozenset(reagents)
+
+
+# Fungsi untuk membangun indeks reaksi (cukup sekali per proses)
+def build_reaction_index(reactions):
+    index = {}
+    for reaction in reactions:
+        # Reaksi pertama yang terdaftar tetap menang, sama seperti pencarian linear lama
+        index.setdefault(reagent_key(*reaction["reagents"]), reaction)
+    return index
+
+
+# Fungsi untuk mencari reaksi antara dua senyawa dalam O(1)
+def find_reaction(index, compound1, compound2):
+    return index.get(reagent_key(compound1, compound2))
@@ -0,0 +1,116 @@
+# Pencarian global unsur, senyawa dan reaksi: indeks terbalik + trie prefiks
+#
+# Entri diberi id menurut peringkatnya (jenis, lalu panjang label), sehingga
+# "hasil terbaik" selalu id terkecil. Setiap simpul trie menyimpan array id
+# terurut untuk seluruh kata di bawahnya, jadi kueri prefiks cukup berjalan
+# sepanjang prefiks dan beberapa kata digabung dengan irisan array NumPy.
+import re
+import unicodedata
+from collections import namedtuple
+
+import numpy as np
+
+from lab_kimia.balance import parse_equation
+from lab_kimia.formula import to_ascii
+
+KIND_ORDER = {"Unsur": 0, "Senyawa": 1, "Reaksi": 2}
+
+# detail ditampilkan ke pengguna; keywords hanya ikut diindeks
+SearchEntry = namedtuple("SearchEntry", ["kind", "label", "detail", "key", "keywords"], defaults=[""])
+
+WORD = re.compile(r"[a-z0-9]+")
+
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+# Teks -> token huruf kecil ASCII: "Asam Sulfat (H₂SO₄)" -> ["asam", "sulfat", "h2so4"]
+def tokenize(text):
+    text = unicodedata.normalize("NFKD", to_ascii(text)).encode("ascii", "ignore").decode()
+    return WORD.findall(text.lower())
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = _EMPTY
+
+
+class SearchIndex:
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda e: (KIND_ORDER.get(e.kind, len(KIND_ORDER)), len(e.label), e.label))
+        postings = {}
+        for entry_id, entry in enumerate(self.entries):
+            for token in set(tokenize(f"{entry.label} {entry.detail} {entry.keywords}")):
+                postings.setdefault(token, []).append(entry_id)
+        self.postings = {token: np.array(ids, dtype=np.int32) for token, ids in postings.items()}
+
+        self.root = _TrieNode()
+        for token, ids in self.postings.items():
+            node = self.root
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+            node.ids = ids
+        self._fill_ids(self.root)
+
+    # Gabungkan id dari bawah ke atas (iteratif agar aman untuk token panjang)
+    def _fill_ids(self, root):
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            if node.children:
+                node.ids = np.unique(np.concatenate([node.ids] + [c.ids for c in node.children.values()]))
+
+    def _node(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    # Kata yang lengkap dicocokkan persis bila ada di indeks, selain itu sebagai
+    # prefiks; kata terakhir selalu prefiks karena pengguna mungkin masih mengetik
+    def search(self, query, limit=10):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        *complete, last = tokens
+        arrays = [self.postings[t] for t in complete if t in self.postings]
+        for prefix in [t for t in complete if t not in self.postings] + [last]:
+            node = self._node(prefix)
+            if node is None:
+                return []
+            arrays.append(node.ids)
+
+        # Irisan dimulai dari array terkecil; hasil tetap terurut menurut peringkat
+        arrays.sort(key=len)
+        result = arrays[0]
+        for other in arrays[1:]:
+            if not len(result):
+                break
+            mask = np.zeros(len(self.entries), dtype=bool)
+            mask[other] = True
+            result = result[mask[result]]
+        return [self.entries[i] for i in result[:limit]]
+
+
+# Fungsi untuk menyusun entri dari dataset aplikasi
+def build_entries(periodic_table, compounds, reactions):
+    entries = []
+    for e in periodic_table:
+        entries.append(SearchEntry("Unsur", f"{e['Name']} ({e['Symbol']})",
+                                   f"No Atom {e['AtomicNumber']} · {e['Category']}", e["AtomicNumber"]))
+    for name, c in compounds.items():
+        entries.append(SearchEntry("Senyawa", name, f"{c['formula']} · {c['type']}", name))
+    for i, r in enumerate(reactions):
+        reactants, products = parse_equation(r["equation"])
+        formulas = " ".join(f for _, f in reactants + products)
+        entries.append(SearchEntry("Reaksi", f"Reaksi {i + 1}: {r['type']}", r["equation"], i,
+                                   f"{formulas} {' '.join(r['reagents'] + r['products'])}"))
+    return entries
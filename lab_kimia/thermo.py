@@ -0,0 +1,152 @@
+# Termokimia: entalpi pembentukan standar dan ΔH semua reaksi
+#
+# ΔH°reaksi = Σ ν·ΔHf°(produk) − Σ ν·ΔHf°(pereaksi). Koefisien semua reaksi
+# disimpan sebagai matriks jarang reaksi x spesi (produk positif, pereaksi
+# negatif): hanya suku yang ada di persamaan, terurut per reaksi seperti CSR.
+# ΔH seluruh reaksi didapat dari satu penjumlahan tervektorisasi saat data
+# dimuat, dan memori sebanding jumlah suku, bukan jumlah reaksi x spesi.
+import numpy as np
+
+from lab_kimia.balance import parse_equation
+
+# ΔHf° (kJ/mol, 298 K) dan wujud yang dipakai, per rumus. Zat yang direaksikan
+# sebagai larutan memakai nilai (aq), yaitu jumlah nilai ion-ionnya, agar sesuai
+# dengan cara reaksi di REACTIONS dilakukan di laboratorium. Unsur dalam wujud
+# standarnya bernilai 0. Fenolftalein (C₂₀H₁₄O₄) tidak memiliki nilai tabel.
+FORMATION_ENTHALPY = {
+    # Asam, basa dan garam terlarut
+    "HCl": (-167.2, "aq"),
+    "HNO₃": (-205.0, "aq"),
+    "H₂SO₄": (-909.3, "aq"),
+    "CH₃COOH": (-485.8, "aq"),
+    "NaOH": (-470.1, "aq"),
+    "KOH": (-482.4, "aq"),
+    "NH₃": (-80.3, "aq"),
+    "NaCl": (-407.3, "aq"),
+    "NaNO₃": (-445.1, "aq"),
+    "Na₂CO₃": (-1157.3, "aq"),
+    "Na₂SO₄": (-1389.5, "aq"),
+    "KI": (-307.6, "aq"),
+    "KNO₃": (-457.4, "aq"),
+    "KMnO₄": (-793.8, "aq"),
+    "K₂SO₄": (-1414.1, "aq"),
+    "CaCl₂": (-877.2, "aq"),
+    "CuSO₄": (-844.5, "aq"),
+    "Cu(NO₃)₂": (-345.2, "aq"),
+    "FeSO₄": (-998.4, "aq"),
+    "FeCl₂": (-423.5, "aq"),
+    "AgNO₃": (-99.4, "aq"),
+    "Pb(NO₃)₂": (-411.7, "aq"),
+    "CH₃COONH₄": (-618.5, "aq"),
+    "H₂O₂": (-191.2, "aq"),
+    # Padatan dan endapan
+    "AgCl": (-127.0, "s"),
+    "PbI₂": (-175.5, "s"),
+    "CaCO₃": (-1207.6, "s"),
+    "MnO₂": (-520.0, "s"),
+    "MgO": (-601.6, "s"),
+    "CaO": (-634.9, "s"),
+    "CaC₂": (-59.8, "s"),
+    "Ca(OH)₂": (-985.2, "s"),
+    "NaHCO₃": (-950.8, "s"),
+    "NH₄NO₃": (-365.6, "s"),
+    "ZnCl₂": (-415.1, "s"),
+    "AlCl₃": (-704.2, "s"),
+    "Na₂S₂O₃": (-1123.0, "s"),
+    "H₃PO₄": (-1284.4, "s"),
+    "KCN": (-113.0, "s"),
+    "CH₃COONa": (-708.8, "s"),
+    "C₆H₁₂O₆": (-1273.3, "s"),
+    "C₆H₈O₇": (-1543.8, "s"),
+    "Fe": (0.0, "s"),
+    "Cu": (0.0, "s"),
+    "Mg": (0.0, "s"),
+    "Na": (0.0, "s"),
+    "I₂": (0.0, "s"),
+    # Cairan
+    "H₂O": (-285.8, "l"),
+    "C₂H₅OH": (-277.7, "l"),
+    "C₆H₆": (49.1, "l"),
+    # Gas
+    "CO₂": (-393.5, "g"),
+    "CO": (-110.5, "g"),
+    "SO₂": (-296.8, "g"),
+    "NO₂": (33.2, "g"),
+    "CH₄": (-74.6, "g"),
+    "C₂H₂": (226.7, "g"),
+    "H₂": (0.0, "g"),
+    "O₂": (0.0, "g"),
+    "Cl₂": (0.0, "g"),
+}
+
+# Jumlah pereaksi pembatas (mol) untuk kurva panas vs jumlah pereaksi
+AMOUNTS = np.linspace(0.0, 1.0, 51)
+
+
+class Thermochemistry:
+    def __init__(self, reactions, table=FORMATION_ENTHALPY):
+        # Satu lintasan: persamaan diurai (di-cache per persamaan dan per suku) dan
+        # setiap suku menjadi triplet (reaksi, kolom spesi, koefisien)
+        lengths, columns, values = [], [], []
+        seen = {}
+        self.index = {}
+        for i, r in enumerate(reactions):
+            self.index[r["equation"]] = i
+            reactants, products = parse_equation(r["equation"])
+            lengths.append(len(reactants) + len(products))
+            columns += [seen.setdefault(f, len(seen)) for _, f in reactants + products]
+            values += [-c for c, _ in reactants] + [c for c, _ in products]
+        rows = np.repeat(np.arange(len(reactions), dtype=np.int64), lengths)
+
+        # Kolom diurutkan menurut rumus; suku spesi yang sama dalam satu reaksi digabung
+        self.species = sorted(seen)
+        self.column = {f: j for j, f in enumerate(self.species)}
+        order = np.empty(len(seen), dtype=np.int64)
+        order[[seen[f] for f in self.species]] = np.arange(len(seen))
+        width = max(len(seen), 1)
+        keys, inverse = np.unique(rows * width + order[np.array(columns, dtype=np.int64)],
+                                  return_inverse=True)
+        merged = np.bincount(inverse, weights=np.array(values, dtype=np.float64))
+        nonzero = merged != 0
+        self.rows, self.columns = np.divmod(keys[nonzero], width)
+        self.values = merged[nonzero]
+        self.indptr = np.searchsorted(self.rows, np.arange(len(reactions) + 1))
+
+        self.formation = np.array([table.get(f, (np.nan, None))[0] for f in self.species])
+        self.states = [table.get(f, (None, None))[1] for f in self.species]
+        self.enthalpy = self.enthalpies(self.formation)
+
+        # Panas yang dilepas per mol setiap pereaksi bila pereaksi itu pembatas:
+        # −ΔH/ν = ΔH/koefisien (koefisien pereaksi negatif); NaN untuk produk
+        reactant = self.values < 0
+        self.heat_per_mole = np.divide(self.enthalpy[self.rows], self.values,
+                                       out=np.full(len(self.values), np.nan), where=reactant)
+
+    # ΔH semua reaksi untuk vektor ΔHf° per spesi: jumlah koefisien x ΔHf° per
+    # baris. Reaksi dengan spesi tanpa nilai ΔHf° (NaN) menjadi NaN.
+    def enthalpies(self, formation):
+        terms = self.values * formation[self.columns]
+        known = ~np.isnan(terms)
+        count = len(self.indptr) - 1
+        result = np.bincount(self.rows[known], weights=terms[known], minlength=count)
+        result[np.bincount(self.rows[~known], minlength=count) > 0] = np.nan
+        return result
+
+    # ΔH° satu reaksi (kJ per persamaan seperti tertulis); NaN jika tidak diketahui
+    def enthalpy_of(self, equation):
+        i = self.index.get(equation)
+        return float("nan") if i is None else float(self.enthalpy[i])
+
+    # Pereaksi (rumus, panas dilepas per mol) satu reaksi, urut seperti persamaannya
+    def reagent_heats(self, equation):
+        i = self.index[equation]
+        start, end = self.indptr[i], self.indptr[i + 1]
+        heats = dict(zip(self.columns[start:end].tolist(), self.heat_per_mole[start:end].tolist()))
+        reactants, _ = parse_equation(equation)
+        return [(f, heats.get(self.column[f], float("nan"))) for _, f in reactants]
+
+    # ΔHf° dan wujud spesi dalam satu reaksi, untuk ditampilkan
+    def formation_of(self, equation):
+        i = self.index[equation]
+        return [(self.species[j], float(self.formation[j]), self.states[j])
+                for j in self.columns[self.indptr[i]:self.indptr[i + 1]].tolist()]